@@ -4,7 +4,8 @@ Clang-based C/C++ code analyzer using libclang
 
 import clang.cindex
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
 import os
 
 from src.utils.libclang_config import ensure_libclang_configured
@@ -12,8 +13,23 @@ from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 
+def _fingerprint(data: bytes) -> str:
+    """Return a fast, non-cryptographic fingerprint of file contents
+
+    Only used to tell whether a source changed since it was parsed, so collision
+    resistance does not matter; xxh3 is used when installed, blake2b otherwise.
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 
 class ClangAnalyzer:
     """C/C++ code analyzer using libclang AST parsing"""
@@ -21,16 +37,43 @@ class ClangAnalyzer:
     def __init__(self):
         # Configure libclang using unified configuration
         ensure_libclang_configured()
+        # Parsed translation units shared by per-function analysis of the same file,
+        # keyed by (file, args). Entries are validated by mtime and size first; when
+        # only the mtime moved (touch, checkout) a content fingerprint decides
+        self._translation_units: Dict[Tuple[str, Tuple[str, ...]], Tuple[int, int, str, Any]] = {}
+        # One libclang index for every parse, created on first use
+        self._index = None
+    
+    def parse_translation_unit(self, file_path: str, compile_args: List[str]):
+        """Parse a file with libclang, reusing the translation unit until the file changes"""
+        key = (file_path, tuple(compile_args))
+        stat = os.stat(file_path)
+        cached = self._translation_units.get(key)
+        if cached is not None and cached[1] == stat.st_size:
+            mtime_ns, size, fingerprint, translation_unit = cached
+            if mtime_ns == stat.st_mtime_ns:
+                return translation_unit
+            if _fingerprint(Path(file_path).read_bytes()) == fingerprint:
+                self._translation_units[key] = (stat.st_mtime_ns, size, fingerprint, translation_unit)
+                return translation_unit
+        
+        fingerprint = _fingerprint(Path(file_path).read_bytes())
+        if self._index is None:
+            self._index = clang.cindex.Index.create()
+        translation_unit = self._index.parse(file_path, args=compile_args,
+                                       options=clang.cindex.TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD)
+        if translation_unit is not None:
+            self._translation_units[key] = (stat.st_mtime_ns, stat.st_size, fingerprint, translation_unit)
+        return translation_unit
     
     def analyze_file(self, file_path: str, compile_args: List[str]) -> List[Dict[str, Any]]:
         """Analyze a C/C++ file and extract function information"""
         logger.info(f"Analyzing {file_path} with args: {compile_args}")
         
-        index = clang.cindex.Index.create()
-        
         try:
-            # First pass: find all function definitions in the TU
-            translation_unit = index.parse(file_path, args=compile_args, options=clang.cindex.TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD)
+            # First pass: find all function definitions in the TU; the parsed unit
+            # is kept for the dependency and macro passes over the same file
+            translation_unit = self.parse_translation_unit(file_path, compile_args)
             
             if translation_unit is None:
                 logger.error(f"Failed to parse {file_path}")
@@ -338,9 +381,7 @@ class ClangAnalyzer:
             return []
         
         try:
-            index = clang.cindex.Index.create()
-            translation_unit = index.parse(file_path, args=compile_args, 
-                                         options=clang.cindex.TranslationUnit.PARSE_DETAILED_PROCESSING_RECORD)
+            translation_unit = self.parse_translation_unit(file_path, compile_args)
             
             if translation_unit is None:
                 return []
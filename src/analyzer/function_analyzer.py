@@ -101,9 +101,9 @@ class FunctionAnalyzer:
         function_name = function_info['name']
         
         try:
-            # Parse the file to get the specific function cursor
-            index = clang.cindex.Index.create()
-            translation_unit = index.parse(file_path, args=compile_args)
+            # Parse the file to get the specific function cursor; the translation
+            # unit is shared by every function analyzed in the same file
+            translation_unit = self.clang_analyzer.parse_translation_unit(file_path, compile_args)
             
             if translation_unit is None:
                 return {}
@@ -10,6 +10,11 @@ from typing import List, Dict, Any, Optional, AsyncIterator, Callable
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
+import sys
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of the
+# packets created for every file and function flowing through the pipeline
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class StreamStage(Enum):
@@ -21,7 +26,7 @@ class StreamStage(Enum):
     COMPLETED = "completed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class StreamPacket:
     """Immutable data packet flowing through the streaming pipeline"""
     stage: StreamStage
@@ -39,7 +44,7 @@ class StreamPacket:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FunctionStreamData:
     """Immutable function data for streaming processing"""
     file_path: str
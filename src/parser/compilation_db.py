@@ -6,6 +6,28 @@ import json
 from pathlib import Path
 from typing import List, Dict, Any
 
+from src.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json(path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    malformed files the same way with either parser.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
 class CompilationDatabaseParser:
     """Parser for compile_commands.json format"""
@@ -23,10 +45,13 @@ class CompilationDatabaseParser:
         if not self.compile_commands_path.exists():
             raise FileNotFoundError(f"compile_commands.json not found at {self.compile_commands_path}")
         
-        with open(self.compile_commands_path, 'r', encoding='utf-8') as f:
-            compile_commands = json.load(f)
+        compile_commands = _load_json(self.compile_commands_path)
         
         compilation_units = []
+        # Identical (file, arguments) entries, e.g. from multi-config builds,
+        # would only be analyzed twice
+        seen_units = set()
+        duplicates = 0
         for command in compile_commands:
             # Resolve relative file paths
             file_path = Path(command['file'])
@@ -52,14 +77,23 @@ class CompilationDatabaseParser:
             else:
                 raise ValueError(f"No 'command' or 'arguments' field found in compile command: {command}")
             
+            unit_key = (file_path_str, tuple(arguments))
+            if unit_key in seen_units:
+                duplicates += 1
+                continue
+            seen_units.add(unit_key)
+            
             unit = {
-                'file': str(file_path.resolve()),
+                'file': file_path_str,
                 'directory': command['directory'],
                 'arguments': arguments,
                 'output': command.get('output', '')
             }
             compilation_units.append(unit)
         
+        if duplicates:
+            logger.debug(f"Skipped {duplicates} duplicate compilation units")
+        
         return compilation_units
     
     def _parse_arguments(self, command: str) -> List[str]:
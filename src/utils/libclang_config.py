@@ -16,6 +16,9 @@ class LibclangConfig:
     """Singleton class for libclang configuration"""
     
     _configured = False
+    # Set once auto-discovery has failed, so repeated ensure_configured()
+    # calls don't re-probe the filesystem and re-log the warning
+    _discovery_failed = False
     
     @classmethod
     def configure(cls, libclang_path: Optional[str] = None) -> bool:
@@ -91,6 +94,8 @@ class LibclangConfig:
                         return True
             
             logger.warning("Could not auto-discover libclang library")
+            if not libclang_path:
+                cls._discovery_failed = True
             return False
             
         except Exception as e:
@@ -100,9 +105,11 @@ class LibclangConfig:
     @classmethod
     def ensure_configured(cls) -> bool:
         """Ensure libclang is configured, auto-discover if not"""
-        if not cls._configured:
-            return cls.configure()
-        return True
+        if cls._configured:
+            return True
+        if cls._discovery_failed:
+            return False
+        return cls.configure()
     
     @classmethod
     def get_status(cls) -> dict:
@@ -1,13 +1,65 @@
 """Prompt templates for LLM test generation with language-specific variations"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+from functools import lru_cache
 import os
 import re
+import sys
 from pathlib import Path
 
 import json
-from src.test_generation.models import PromptContext
-from src.utils.prompt_template_loader import PromptTemplateLoader
+from src.test_generation.models import PromptContext, Language
+from src.utils.prompt_template_loader import PromptTemplateLoader, TemplateValidationError
+from src.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+_LINE_SUFFIX_RE = re.compile(r':\d+$')
+
+
+@lru_cache(maxsize=8)
+def _language_names(language: Language) -> Tuple[str, str]:
+    """Return the interned (value, display name) pair for a language"""
+    return sys.intern(language.value), sys.intern(language.display_name)
+
+
+@lru_cache(maxsize=1024)
+def _source_stem(source_path: str) -> str:
+    """Return the interned file stem used for test class naming"""
+    return sys.intern(Path(source_path).stem)
+
+
+class _LazyValue:
+    """Context value computed only when a template actually references it"""
+
+    __slots__ = ('_factory', '_value', '_resolved')
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+        self._resolved = False
+
+    def resolve(self) -> Any:
+        """Compute the wrapped value once and return the cached result"""
+        if not self._resolved:
+            self._value = self._factory()
+            self._resolved = True
+            self._factory = None
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
 
 class PromptTemplates:
     """Templates for generating high-quality test generation prompts"""
@@ -87,10 +139,10 @@ class PromptTemplates:
         deps = ctx.dependencies
         comp = ctx.compilation_info
         
-        # Get filename for test class naming
-        full_path = target.location
-        clean_path = re.sub(r':\d+$', '', full_path)
-        filename = Path(clean_path).stem
+        # Get filename for test class naming; functions from the same source
+        # file share a single interned stem string
+        filename = _source_stem(_LINE_SUFFIX_RE.sub('', target.location))
+        language, language_display = _language_names(target.language)
         
         # Prepare comprehensive context for Jinja2 templates
         context = {
@@ -102,8 +154,8 @@ class PromptTemplates:
             'filename': filename,
             
             # Language information
-            'language': target.language.value,
-            'language_display': target.language.display_name,
+            'language': language,
+            'language_display': language_display,
             
             # Dependencies (matching template variables)
             'dependency_definitions': deps.dependency_definitions if deps else [],
@@ -111,7 +163,9 @@ class PromptTemplates:
             'called_functions': deps.called_functions if deps else [],
             
             # Existing tests context - extract test code from ExistingTestsContext
-            'existing_tests': PromptTemplates._extract_existing_tests(ctx.existing_tests_context),
+            'existing_tests': _LazyValue(
+                lambda: PromptTemplates._extract_existing_tests(ctx.existing_tests_context)
+            ),
             'existing_fixture_code': ctx.existing_fixture_code,
             'suite_name': ctx.suite_name,
             
@@ -122,14 +176,13 @@ class PromptTemplates:
             
             # Additional context
             'has_external_dependencies': ctx.has_external_dependencies,
-            'needs_mocking': ctx.has_external_dependencies
+            'needs_mocking': ctx.has_external_dependencies,
+
+            # Rendering mock_guidance.j2 is a nested template render, so it only
+            # happens if the selected template actually uses mock_guidance
+            'mock_guidance': _LazyValue(lambda: PromptTemplates._generate_mock_guidance(ctx))
         }
         
-        # Generate mock_guidance by rendering the mock_guidance.j2 template
-        mock_guidance = PromptTemplates._generate_mock_guidance(ctx)
-        if mock_guidance:
-            context['mock_guidance'] = mock_guidance
-        
         return context
     
     @staticmethod
@@ -183,9 +236,9 @@ class PromptTemplates:
 
             # Render the mock_guidance.j2 template
             return loader.render_template('base/sections/mock_guidance.j2', mock_context)
-        except Exception as e:
-            # If template rendering fails, return empty string
-            print(f"Warning: Failed to render mock_guidance template: {e}")
+        except (TemplateValidationError, AttributeError):
+            # If template rendering fails, fall back to the template's default guidance
+            logger.warning("Failed to render mock_guidance template", exc_info=True)
             return ""
     
     @staticmethod
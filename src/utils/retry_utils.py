@@ -3,14 +3,17 @@ Retry utilities with exponential backoff for resilient operations.
 """
 
 import asyncio
+import logging
 import random
+import threading
 import time
 from functools import wraps
+from itertools import count
 from typing import (
     Any, Callable, Dict, List, Optional, Type, Union,
     TypeVar, Tuple, Awaitable
 )
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from src.utils.logging_utils import get_logger
@@ -41,6 +44,63 @@ class RetryConfig:
     retryable_exceptions: Tuple[Type[Exception], ...] = (Exception,)
     non_retryable_exceptions: Tuple[Type[Exception], ...] = ()
     on_retry_callback: Optional[Callable[[Exception, int], None]] = None
+    # Async delays at or below this just yield to the event loop instead of
+    # scheduling a timer
+    min_sleep: float = 0.001
+    # Setting this event aborts a sync retry loop that is waiting between attempts
+    stop_event: Optional[threading.Event] = None
+
+    # Deterministic part of each attempt's delay, built once per config
+    _base_delays: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _use_jitter: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the per-attempt delay table"""
+        self._use_jitter = (
+            self.jitter and self.backoff_strategy == BackoffStrategy.EXPONENTIAL_WITH_JITTER
+        )
+        # A jittered delay never drops below 75% of its base, so any base above
+        # max_delay / 0.75 always ends up capped; clamping there keeps the
+        # result identical while avoiding overflow for large attempt counts
+        cap = self.max_delay / (1 - _JITTER_FRACTION) if self._use_jitter else self.max_delay
+        self._base_delays = tuple(
+            min(_base_delay(attempt, self.base_delay, self.backoff_strategy,
+                            self.backoff_multiplier), cap)
+            for attempt in range(1, self.max_attempts + 1)
+        )
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the delay to wait after the given (1-based) failed attempt"""
+        delay = self._base_delays[attempt - 1]
+        if self._use_jitter:
+            delay = _add_jitter(delay)
+        return min(delay, self.max_delay)
+
+
+class RetryAborted(Exception):
+    """Raised when a retry loop is stopped through RetryConfig.stop_event"""
+    pass
+
+
+class RetryExhaustedError(Exception):
+    """Raised when every retry attempt failed; the last error is the __cause__"""
+
+    def __init__(self, func_name: str, attempts: int):
+        super().__init__(f"Function {func_name} failed after {attempts} attempts")
+        self.func_name = func_name
+        self.attempts = attempts
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open"""
+    pass
 
 
 class CircuitBreaker:
@@ -57,8 +117,17 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
 
         self.failure_count = 0
-        self.last_failure_time = None
-        self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        self.state = CircuitState.CLOSED
+        # Monotonic time at which an OPEN circuit admits its HALF_OPEN trial,
+        # fixed once when the circuit opens
+        self._reset_deadline = 0.0
+
+        # Guards every state transition. The critical sections never await,
+        # so a thread lock is safe for coroutines and for callers that run
+        # the decorated function on several event loops/threads.
+        self._lock = threading.Lock()
+        # Only one trial call may be in flight while HALF_OPEN
+        self._trial_in_flight = False
 
         self.logger = get_logger(self.__class__.__name__)
 
@@ -67,47 +136,100 @@ class CircuitBreaker:
 
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
-            if self.state == 'OPEN':
-                if self._should_attempt_reset():
-                    self.state = 'HALF_OPEN'
-                    self.logger.info("Circuit breaker entering HALF_OPEN state")
-                else:
-                    raise Exception("Circuit breaker is OPEN")
+            self._before_call()
 
             try:
                 result = await func(*args, **kwargs)
-                self._on_success()
-                return result
-            except self.expected_exception as e:
+            except self.expected_exception:
                 self._on_failure()
                 raise
+            except BaseException:
+                self._release_trial()
+                raise
+
+            self._on_success()
+            return result
 
         return wrapper
 
-    def _should_attempt_reset(self) -> bool:
-        """Check if we should attempt to reset the circuit breaker"""
-        return (
-            self.last_failure_time and
-            time.time() - self.last_failure_time >= self.recovery_timeout
-        )
+    def _before_call(self):
+        """Admit or reject a call, entering HALF_OPEN when recovery is due"""
+        # Fast paths: a closed circuit needs no transition, and an open one
+        # rejects without taking the lock until its deadline passes
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return
+        if state == CircuitState.OPEN and time.monotonic() < self._reset_deadline:
+            raise CircuitOpenError("Circuit breaker is OPEN")
+
+        with self._lock:
+            # Re-check under the lock; another caller may have transitioned
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() < self._reset_deadline:
+                    raise CircuitOpenError("Circuit breaker is OPEN")
+                self.state = CircuitState.HALF_OPEN
+                self.logger.info("Circuit breaker entering HALF_OPEN state")
+
+            if self.state == CircuitState.HALF_OPEN:
+                if self._trial_in_flight:
+                    raise CircuitOpenError("Circuit breaker is OPEN")
+                self._trial_in_flight = True
+
+    def _release_trial(self):
+        """Allow the next HALF_OPEN trial after a call ends without a verdict"""
+        with self._lock:
+            self._trial_in_flight = False
 
     def _on_success(self):
         """Handle successful call"""
-        if self.state == 'HALF_OPEN':
-            self.state = 'CLOSED'
-            self.logger.info("Circuit breaker reset to CLOSED state")
-        self.failure_count = 0
+        with self._lock:
+            self._trial_in_flight = False
+            if self.state == CircuitState.HALF_OPEN:
+                self.state = CircuitState.CLOSED
+                self.logger.info("Circuit breaker reset to CLOSED state")
+            self.failure_count = 0
 
     def _on_failure(self):
         """Handle failed call"""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self._trial_in_flight = False
+            self.failure_count += 1
+
+            if self.failure_count >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                self._reset_deadline = time.monotonic() + self.recovery_timeout
+                self.logger.warning(
+                    "Circuit breaker opened after %d failures", self.failure_count
+                )
+
+
+# Jitter spreads a delay by ±25%
+_JITTER_FRACTION = 0.25
+_JITTER_LOW = 1 - _JITTER_FRACTION
+_JITTER_SPAN = 2 * _JITTER_FRACTION
+_rand = random.random
+
+
+def _base_delay(
+    attempt: int,
+    base_delay: float,
+    strategy: BackoffStrategy,
+    multiplier: float
+) -> float:
+    """Calculate the delay for a given attempt before jitter and capping"""
+    if strategy == BackoffStrategy.LINEAR:
+        return base_delay * attempt
+    if strategy in (BackoffStrategy.EXPONENTIAL, BackoffStrategy.EXPONENTIAL_WITH_JITTER):
+        try:
+            return base_delay * (multiplier ** (attempt - 1))
+        except OverflowError:
+            return float('inf')
+    return base_delay
+
 
-        if self.failure_count >= self.failure_threshold:
-            self.state = 'OPEN'
-            self.logger.warning(
-                f"Circuit breaker opened after {self.failure_count} failures"
-            )
+def _add_jitter(delay: float) -> float:
+    """Add jitter: ±25% of the delay"""
+    return delay * (_JITTER_LOW + _JITTER_SPAN * _rand())
 
 
 def calculate_delay(
@@ -120,22 +242,9 @@ def calculate_delay(
 ) -> float:
     """Calculate delay for a given attempt"""
 
-    if strategy == BackoffStrategy.FIXED:
-        delay = base_delay
-    elif strategy == BackoffStrategy.LINEAR:
-        delay = base_delay * attempt
-    elif strategy == BackoffStrategy.EXPONENTIAL:
-        delay = base_delay * (multiplier ** (attempt - 1))
-    elif strategy == BackoffStrategy.EXPONENTIAL_WITH_JITTER:
-        exponential_delay = base_delay * (multiplier ** (attempt - 1))
-        if jitter:
-            # Add jitter: ±25% of the delay
-            jitter_range = exponential_delay * 0.25
-            delay = exponential_delay + random.uniform(-jitter_range, jitter_range)
-        else:
-            delay = exponential_delay
-    else:
-        delay = base_delay
+    delay = _base_delay(attempt, base_delay, strategy, multiplier)
+    if jitter and strategy == BackoffStrategy.EXPONENTIAL_WITH_JITTER:
+        delay = _add_jitter(delay)
 
     return min(delay, max_delay)
 
@@ -180,50 +289,40 @@ def _async_retry_decorator(
 
     @wraps(func)
     async def wrapper(*args, **kwargs) -> T:
-        last_exception = None
-
-        for attempt in range(1, config.max_attempts + 1):
+        # Every attempt either returns or raises; the terminal attempt
+        # re-raises without computing a delay or sleeping
+        for attempt in count(1):
             try:
                 return await func(*args, **kwargs)
             except config.non_retryable_exceptions as e:
                 # Don't retry on non-retryable exceptions
-                logger.error(f"Non-retryable exception in {func.__name__}: {e}")
+                logger.error("Non-retryable exception in %s: %s", func.__name__, e)
                 raise
             except config.retryable_exceptions as e:
-                last_exception = e
-
-                if attempt == config.max_attempts:
-                    logger.error(
-                        f"Function {func.__name__} failed after {config.max_attempts} attempts. "
-                        f"Last error: {e}"
-                    )
-                    raise
-
-                # Calculate delay
-                delay = calculate_delay(
-                    attempt=attempt,
-                    base_delay=config.base_delay,
-                    strategy=config.backoff_strategy,
-                    multiplier=config.backoff_multiplier,
-                    max_delay=config.max_delay,
-                    jitter=config.jitter
-                )
-
-                # Log retry attempt
-                logger.warning(
-                    f"Attempt {attempt}/{config.max_attempts} failed for {func.__name__}: {e}. "
-                    f"Retrying in {delay:.2f}s..."
-                )
-
-                # Call retry callback if provided
-                if config.on_retry_callback:
-                    config.on_retry_callback(e, attempt)
-
-                # Wait before retry
-                await asyncio.sleep(delay)
-
-        # This should never be reached
-        raise last_exception
+                if attempt >= config.max_attempts:
+                    # Leave logging to whoever handles the chained error
+                    raise RetryExhaustedError(func.__name__, config.max_attempts) from e
+                else:
+                    # Look up delay in the config's precomputed table
+                    delay = config.get_delay(attempt)
+
+                    # Log retry attempt; arguments are only formatted if a
+                    # handler actually emits the record
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Attempt %d/%d failed for %s: %s. Retrying in %.2fs...",
+                            attempt, config.max_attempts, func.__name__, e, delay
+                        )
+
+                    # Call retry callback if provided
+                    if config.on_retry_callback:
+                        config.on_retry_callback(e, attempt)
+
+                    # Wait before retry
+                    if delay <= config.min_sleep:
+                        await asyncio.sleep(0)
+                    else:
+                        await asyncio.sleep(delay)
 
     return wrapper
 
@@ -236,50 +335,42 @@ def _sync_retry_decorator(
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
-        last_exception = None
-
-        for attempt in range(1, config.max_attempts + 1):
+        # Every attempt either returns or raises; the terminal attempt
+        # re-raises without computing a delay or sleeping
+        for attempt in count(1):
             try:
                 return func(*args, **kwargs)
             except config.non_retryable_exceptions as e:
                 # Don't retry on non-retryable exceptions
-                logger.error(f"Non-retryable exception in {func.__name__}: {e}")
+                logger.error("Non-retryable exception in %s: %s", func.__name__, e)
                 raise
             except config.retryable_exceptions as e:
-                last_exception = e
-
-                if attempt == config.max_attempts:
-                    logger.error(
-                        f"Function {func.__name__} failed after {config.max_attempts} attempts. "
-                        f"Last error: {e}"
-                    )
-                    raise
-
-                # Calculate delay
-                delay = calculate_delay(
-                    attempt=attempt,
-                    base_delay=config.base_delay,
-                    strategy=config.backoff_strategy,
-                    multiplier=config.backoff_multiplier,
-                    max_delay=config.max_delay,
-                    jitter=config.jitter
-                )
-
-                # Log retry attempt
-                logger.warning(
-                    f"Attempt {attempt}/{config.max_attempts} failed for {func.__name__}: {e}. "
-                    f"Retrying in {delay:.2f}s..."
-                )
-
-                # Call retry callback if provided
-                if config.on_retry_callback:
-                    config.on_retry_callback(e, attempt)
-
-                # Wait before retry
-                time.sleep(delay)
-
-        # This should never be reached
-        raise last_exception
+                if attempt >= config.max_attempts:
+                    # Leave logging to whoever handles the chained error
+                    raise RetryExhaustedError(func.__name__, config.max_attempts) from e
+                else:
+                    # Look up delay in the config's precomputed table
+                    delay = config.get_delay(attempt)
+
+                    # Log retry attempt; arguments are only formatted if a
+                    # handler actually emits the record
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Attempt %d/%d failed for %s: %s. Retrying in %.2fs...",
+                            attempt, config.max_attempts, func.__name__, e, delay
+                        )
+
+                    # Call retry callback if provided
+                    if config.on_retry_callback:
+                        config.on_retry_callback(e, attempt)
+
+                    # Wait before retry; Event.wait returns early once stop_event is set
+                    if config.stop_event is None:
+                        time.sleep(delay)
+                    elif config.stop_event.wait(delay):
+                        raise RetryAborted(
+                            f"Retry of {func.__name__} aborted after attempt {attempt}"
+                        ) from e
 
     return wrapper
 
@@ -1,32 +1,38 @@
 import os
 import re
 
+_INCLUDE_RE = re.compile(r'#include\s*[<\"].*?[>\"]')
+_MAIN_RE = re.compile(
+    r"(int\s+main\(int\s+argc,\s*char\s*\*\*\s*argv\)\s*\{[\s\S]*?^\})",
+    re.MULTILINE,
+)
+
+
 class TestFileAggregator:
     """Aggregates GTest test cases into a single file."""
 
-    def __init__(self):
-        self.include_pattern = re.compile(r'#include\s*[<\"].*?[>\"]')
-        self.test_case_pattern = re.compile(
-            r"(^{TEST(_[FP])?\(.*\)\s*\{[\s\S]*?^\})", re.MULTILINE
-        )
-        self.main_pattern = re.compile(
-            r"(int\s+main\(int\s+argc,\s*char\s*\*\*\s*argv\)\s*\{[\s\S]*?^\})",
-            re.MULTILINE,
-        )
-
     def _extract_parts(self, content: str):
-        includes = self.include_pattern.findall(content)
-        main_match = self.main_pattern.search(content)
+        include_matches = list(_INCLUDE_RE.finditer(content))
+        includes = [m.group(0) for m in include_matches]
+        main_match = _MAIN_RE.search(content)
         main_block = main_match.group(1) if main_match else None
 
-        # To get the body, remove includes and main
-        body_content = content
-        if main_block:
-            body_content = body_content.replace(main_block, "")
-        for inc in includes:
-            body_content = body_content.replace(inc, "")
-        
-        return sorted(list(set(includes))), body_content.strip(), main_block
+        # To get the body, cut the include and main spans out in one pass
+        spans = [m.span() for m in include_matches]
+        if main_match:
+            spans.append(main_match.span(1))
+        spans.sort()
+
+        pieces = []
+        pos = 0
+        for start, end in spans:
+            if start > pos:
+                pieces.append(content[pos:start])
+            pos = max(pos, end)
+        pieces.append(content[pos:])
+        body_content = "".join(pieces)
+
+        return list(dict.fromkeys(includes)), body_content.strip(), main_block
 
     def aggregate(self, target_filepath: str, new_content: str):
         """
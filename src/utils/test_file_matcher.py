@@ -9,7 +9,8 @@
 
 import os
 import re
-from typing import Dict, List, Optional, Set, Tuple, Any
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
 from pathlib import Path
 
 from src.utils.logging_utils import get_logger
@@ -17,6 +18,87 @@ from src.utils.error_handler import with_error_handling
 
 logger = get_logger(__name__)
 
+# 测试函数匹配正则，一次扫描同时识别三种格式:
+# Google Test 的 TEST(TestSuite, TestName) / TEST_F(TestFixture, TestName)，
+# 以及普通函数 void test_function_name()
+_TEST_FUNCTION_RE = re.compile(
+    r'TEST(?P<fixture>_F)?\s*\(\s*(?P<suite>[^,]+)\s*,\s*(?P<name>[^)]+)\s*\)'
+    r'|(?:void|int)\s+(?P<func>test_\w+)\s*\([^)]*\)'
+)
+
+
+# Google Test fixture 类定义: class ClassName : public ::testing::Test { ... };
+_TEST_CLASS_RE = re.compile(
+    r'class\s+(\w+)\s*:\s*public\s+::testing::Test\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\};',
+    re.MULTILINE | re.DOTALL
+)
+
+# BDD 风格关键字按优先级排列 (如: function_When_Condition_Should_Result)
+_BDD_KEYWORDS = ('_when', '_should', '_given', '_then')
+
+# 常见的测试后缀，彼此互不为后缀，因此一次锚定匹配即可移除
+_TEST_NAME_SUFFIX_RE = re.compile(r'_(?:basic|simple|complex|edge_case|error|null|invalid)\Z')
+
+
+@lru_cache(maxsize=4096)
+def _target_function_name(test_name: str) -> str:
+    """从测试函数名中提取被测函数名，同名测试在多次匹配中只计算一次"""
+    # 移除常见的测试前缀和后缀
+    name = test_name.lower()
+    
+    # 移除 test_ 前缀
+    if name.startswith('test_'):
+        name = name[5:]
+    
+    # 移除 _test 后缀
+    if name.endswith('_test'):
+        name = name[:-5]
+    
+    # 提取优先级最高的 BDD 关键字之前的部分
+    for keyword in _BDD_KEYWORDS:
+        index = name.find(keyword)
+        if index != -1:
+            name = name[:index]
+            break
+    
+    # 移除常见的测试后缀
+    return _TEST_NAME_SUFFIX_RE.sub('', name, count=1)
+
+def _split_name(filename: str) -> Tuple[str, str]:
+    """把文件名拆分为 (stem, 扩展名)，与 Path.stem / Path.suffix 一致"""
+    stem, dot, ext = filename.rpartition('.')
+    if not dot or not stem or not ext:
+        return filename, ''
+    return stem, dot + ext
+
+
+def _iter_files(directory: str) -> Iterator[os.DirEntry]:
+    """
+    递归遍历目录下的文件，遍历顺序与 os.walk 相同
+    
+    使用 os.scandir 直接返回 DirEntry，避免为每个文件构造 Path 对象；
+    与 os.walk 一样不进入符号链接目录，并忽略无法访问的目录
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield entry
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        # 逆序入栈，保证按目录顺序深度优先遍历
+        stack.extend(reversed(subdirs))
+
 
 class TestFileMatcher:
     """测试文件匹配器"""
@@ -44,6 +126,21 @@ class TestFileMatcher:
         self.header_extensions = {'.h', '.hpp', '.hh', '.hxx', '.h++'}
         # 支持的测试文件扩展名
         self.test_extensions = {'.c', '.cpp', '.cc', '.cxx', '.c++'}
+        # 测试文件名匹配正则（xxx_test.ext 或 test_xxx.ext，忽略大小写）
+        test_exts = '|'.join(re.escape(ext[1:]) for ext in sorted(self.test_extensions, key=len, reverse=True))
+        self._test_file_re = re.compile(rf'(?:_test|\Atest_.*)\.(?:{test_exts})\Z', re.IGNORECASE | re.DOTALL)
+        
+        # 测试目录索引，首次使用时通过一次目录遍历构建
+        # _test_files: 测试文件名 -> 完整路径
+        # _test_index: 源文件名(小写，去掉 _test/test_) -> 测试文件路径
+        self._test_files: Optional[Dict[str, str]] = None
+        self._test_index: Optional[Dict[str, str]] = None
+        # 项目源文件索引，首次查找头文件的实现文件时构建
+        self._source_index: Optional[Dict[str, List[str]]] = None
+        # 源文件 -> 匹配的测试文件（或 None），与上面的索引一样在匹配器生命周期内有效
+        self._match_cache: Dict[str, Optional[str]] = {}
+        # 测试文件解析缓存: 测试文件路径 -> (mtime_ns, 文件大小, 文件内容, 测试函数头列表, 函数体缓存)
+        self._parsed_tests: Dict[str, Tuple[int, int, str, List[Tuple[str, str, int]], Dict[int, str]]] = {}
         
         logger.info(f"初始化测试文件匹配器: 项目路径={self.project_path}, 测试目录={self.test_directory}")
     
@@ -59,17 +156,41 @@ class TestFileMatcher:
             logger.warning(f"测试目录不存在: {self.test_directory}")
             return {}
         
-        test_files = {}
-        
-        for root, dirs, files in os.walk(self.test_directory):
-            for file in files:
-                if self._is_test_file(file):
-                    file_path = Path(root) / file
-                    test_files[file] = str(file_path)
+        if self._test_files is None:
+            self._build_test_index()
+        test_files = dict(self._test_files)
         
         logger.info(f"找到 {len(test_files)} 个测试文件")
         return test_files
     
+    def _build_test_index(self) -> None:
+        """
+        遍历一次测试目录，建立测试文件索引
+        
+        同一源文件存在多个匹配的测试文件时，保留遍历中最先找到的一个
+        """
+        test_files = {}
+        test_index = {}
+        
+        is_test_file = self._test_file_re.search
+        for entry in _iter_files(str(self.test_directory)):
+            file = entry.name
+            if not is_test_file(file):
+                continue
+            file_path = entry.path
+            test_files[file] = file_path
+            
+            name = _split_name(file)[0].lower()
+            # xxx_test 格式
+            if name.endswith('_test'):
+                test_index.setdefault(name[:-len('_test')], file_path)
+            # test_xxx 格式
+            if name.startswith('test_'):
+                test_index.setdefault(name[len('test_'):], file_path)
+        
+        self._test_files = test_files
+        self._test_index = test_index
+    
     def _is_test_file(self, filename: str) -> bool:
         """
         判断文件是否为测试文件
@@ -85,23 +206,7 @@ class TestFileMatcher:
         Returns:
             bool: 是否为测试文件
         """
-        file_path = Path(filename)
-        extension = file_path.suffix.lower()
-        
-        if extension not in self.test_extensions:
-            return False
-        
-        name = file_path.stem.lower()
-        
-        # 支持 xxx_test 命名规范
-        if name.endswith('_test'):
-            return True
-        
-        # 可选支持 test_xxx 命名规范
-        if name.startswith('test_'):
-            return True
-        
-        return False
+        return self._test_file_re.search(filename) is not None
     
     @with_error_handling(context="匹配测试文件", critical=False)
     def find_matching_test_file(self, source_file_path: str) -> Optional[str]:
@@ -120,12 +225,27 @@ class TestFileMatcher:
         if not source_path.is_absolute():
             source_path = self.project_path / source_path
         
-        # 获取源文件的基本信息
-        source_name = source_path.stem
-        source_extension = source_path.suffix.lower()
+        # 同一源文件中的每个函数都会查询匹配结果，只在首次查询时探测文件系统
+        cache_key = os.path.normpath(str(source_path))
+        if cache_key in self._match_cache:
+            return self._match_cache[cache_key]
         
+        test_file = self._match_source_file(source_path)
+        self._match_cache[cache_key] = test_file
+        return test_file
+    
+    def _match_source_file(self, source_path: Path) -> Optional[str]:
+        """
+        为绝对路径的源文件查找匹配的测试文件（不经过缓存）
+        
+        Args:
+            source_path: 源文件绝对路径
+            
+        Returns:
+            Optional[str]: 匹配的测试文件路径，如果没有找到则返回None
+        """
         # 处理头文件：查找对应的实现文件
-        if source_extension in self.header_extensions:
+        if source_path.suffix.lower() in self.header_extensions:
             impl_candidates = self._find_implementation_files(source_path)
             for impl_file in impl_candidates:
                 test_file = self._find_test_file_for_source(impl_file)
@@ -156,17 +276,28 @@ class TestFileMatcher:
             if impl_path.exists():
                 candidates.append(impl_path)
         
-        # 在项目中递归查找同名的实现文件
-        for root, dirs, files in os.walk(self.project_path):
-            for file in files:
-                file_path = Path(root) / file
-                if (file_path.stem == header_name and 
-                    file_path.suffix.lower() in self.source_extensions and
-                    file_path not in candidates):
-                    candidates.append(file_path)
+        # 在项目源文件索引中查找同名的实现文件
+        if self._source_index is None:
+            self._build_source_index()
+        for source_file in self._source_index.get(header_name, ()):
+            # 只为匹配的文件构造 Path
+            file_path = Path(source_file)
+            if file_path not in candidates:
+                candidates.append(file_path)
         
         return candidates
     
+    def _build_source_index(self) -> None:
+        """遍历一次项目目录，建立 源文件名(不含扩展名) -> 源文件路径列表 的索引"""
+        source_index: Dict[str, List[str]] = {}
+        
+        for entry in _iter_files(str(self.project_path)):
+            stem, extension = _split_name(entry.name)
+            if extension.lower() in self.source_extensions:
+                source_index.setdefault(stem, []).append(entry.path)
+        
+        self._source_index = source_index
+    
     def _find_test_file_for_source(self, source_path: Path) -> Optional[str]:
         """
         为源文件查找对应的测试文件
@@ -187,13 +318,10 @@ class TestFileMatcher:
             if test_path.exists():
                 return str(test_path)
         
-        # 递归查找测试目录中的匹配文件
-        for root, dirs, files in os.walk(self.test_directory):
-            for file in files:
-                if self._is_matching_test_file(file, source_name):
-                    return str(Path(root) / file)
-        
-        return None
+        # 在测试目录索引中查找匹配文件
+        if self._test_index is None:
+            self._build_test_index()
+        return self._test_index.get(source_name.lower())
     
     def _is_matching_test_file(self, test_filename: str, source_name: str) -> bool:
         """
@@ -221,12 +349,15 @@ class TestFileMatcher:
         return False
     
     @with_error_handling(context="解析测试函数", critical=False)
-    def extract_test_functions(self, test_file_path: str) -> List[Dict[str, str]]:
+    def extract_test_functions(self, test_file_path: str,
+                               name_filter: Optional[str] = None) -> List[Dict[str, str]]:
         """
         从测试文件中提取测试函数信息
         
         Args:
             test_file_path: 测试文件路径
+            name_filter: 被测函数名；指定时只返回与该函数相关的测试，
+                         且只为这些测试提取函数体
             
         Returns:
             List[Dict[str, str]]: 测试函数信息列表，每个字典包含:
@@ -234,51 +365,23 @@ class TestFileMatcher:
                 - target_function: 被测函数名（从测试函数名推断）
                 - code: 测试函数代码
         """
-        try:
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"读取测试文件失败 {test_file_path}: {e}")
+        parsed = self._scan_test_file(test_file_path)
+        if parsed is None:
             return []
         
-        test_functions = []
+        content, test_headers, bodies = parsed
+        function_name_lower = name_filter.lower() if name_filter is not None else None
         
-        # 匹配测试函数的正则表达式
-        # 支持 Google Test 格式: TEST(TestSuite, TestName) 和 TEST_F(TestFixture, TestName)
-        # 支持普通函数格式: void test_function_name()
-        patterns = [
-            # Google Test 格式 - 简化版本，匹配到函数体开始
-            r'TEST\s*\(\s*([^,]+)\s*,\s*([^)]+)\s*\)',
-            r'TEST_F\s*\(\s*([^,]+)\s*,\s*([^)]+)\s*\)',
-            # 普通函数格式
-            r'(?:void|int)\s+(test_\w+)\s*\([^)]*\)'
-        ]
-        
-        # 先处理Google Test格式 (TEST)
-        gtest_pattern = r'TEST\s*\(\s*([^,]+)\s*,\s*([^)]+)\s*\)'
-        gtest_matches = re.finditer(gtest_pattern, content, re.MULTILINE | re.DOTALL)
-        for match in gtest_matches:
-            test_suite = match.group(1).strip()
-            test_name = match.group(2).strip()
-            full_name = f"TEST({test_suite}, {test_name})"
-            target_function = self._extract_target_function_from_test_name(test_name)
-            test_code = self._extract_function_body(content, match.end())
+        test_functions = []
+        for index, (full_name, target_function, body_pos) in enumerate(test_headers):
+            if (function_name_lower is not None and
+                    not self._is_related_test(full_name, target_function, function_name_lower)):
+                continue
             
-            test_functions.append({
-                'name': full_name,
-                'target_function': target_function,
-                'code': test_code
-            })
-        
-        # 处理Google Test Fixture格式 (TEST_F)
-        gtest_f_pattern = r'TEST_F\s*\(\s*([^,]+)\s*,\s*([^)]+)\s*\)'
-        gtest_f_matches = re.finditer(gtest_f_pattern, content, re.MULTILINE | re.DOTALL)
-        for match in gtest_f_matches:
-            test_fixture = match.group(1).strip()
-            test_name = match.group(2).strip()
-            full_name = f"TEST_F({test_fixture}, {test_name})"
-            target_function = self._extract_target_function_from_test_name(test_name)
-            test_code = self._extract_function_body(content, match.end())
+            # 函数体按需提取并缓存
+            test_code = bodies.get(index)
+            if test_code is None:
+                test_code = bodies[index] = self._extract_function_body(content, body_pos)
             
             test_functions.append({
                 'name': full_name,
@@ -286,22 +389,73 @@ class TestFileMatcher:
                 'code': test_code
             })
         
-        # 再处理普通函数格式
-        func_pattern = r'(?:void|int)\s+(test_\w+)\s*\([^)]*\)'
-        func_matches = re.finditer(func_pattern, content, re.MULTILINE | re.DOTALL)
-        for match in func_matches:
-            full_name = match.group(1).strip()
-            target_function = self._extract_target_function_from_test_name(full_name)
-            test_code = self._extract_function_body(content, match.end())
+        return test_functions
+    
+    def _scan_test_file(self, test_file_path: str) -> Optional[Tuple[str, List[Tuple[str, str, int]], Dict[int, str]]]:
+        """
+        读取测试文件并识别其中的测试函数，结果按 (mtime, 文件大小) 缓存
+        
+        Args:
+            test_file_path: 测试文件路径
             
-            test_functions.append({
-                'name': full_name,
-                'target_function': target_function,
-                'code': test_code
-            })
+        Returns:
+            (文件内容, [(测试名, 被测函数名, 函数体起始位置)], 已提取的函数体缓存)，
+            读取失败时返回None
+        """
+        cache_key = str(test_file_path)
+        try:
+            stat = os.stat(test_file_path)
+            # 文件未修改时直接复用上次的解析结果
+            cached = self._parsed_tests.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2:]
+            
+            with open(test_file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            logger.error(f"读取测试文件失败 {test_file_path}: {e}")
+            return None
+        
+        test_headers = []
+        
+        for match in _TEST_FUNCTION_RE.finditer(content):
+            func_name = match.group('func')
+            if func_name:
+                # 普通函数格式
+                full_name = func_name
+                test_name = func_name
+            else:
+                # Google Test 格式 (TEST / TEST_F)
+                macro = 'TEST_F' if match.group('fixture') else 'TEST'
+                test_suite = match.group('suite').strip()
+                test_name = match.group('name').strip()
+                full_name = f"{macro}({test_suite}, {test_name})"
+            
+            target_function = self._extract_target_function_from_test_name(test_name)
+            test_headers.append((full_name, target_function, match.end()))
         
-        logger.info(f"从 {test_file_path} 中提取到 {len(test_functions)} 个测试函数")
-        return test_functions
+        logger.info(f"从 {test_file_path} 中提取到 {len(test_headers)} 个测试函数")
+        bodies: Dict[int, str] = {}
+        self._parsed_tests[cache_key] = (stat.st_mtime_ns, stat.st_size, content, test_headers, bodies)
+        return content, test_headers, bodies
+    
+    @staticmethod
+    def _is_related_test(test_name: str, target_function: str, function_name_lower: str) -> bool:
+        """
+        判断测试是否与指定函数相关
+        
+        Args:
+            test_name: 测试函数名
+            target_function: 从测试名推断的被测函数名
+            function_name_lower: 小写的函数名
+            
+        Returns:
+            bool: 是否相关
+        """
+        target_func = target_function.lower()
+        return (target_func == function_name_lower or
+                function_name_lower in test_name.lower() or
+                target_func in function_name_lower)
     
     def _extract_function_body(self, content: str, start_pos: int) -> str:
         """
@@ -319,21 +473,25 @@ class TestFileMatcher:
         if brace_start == -1:
             return ""
         
-        # 计算匹配的 }
+        # 计算匹配的 }，用 str.find 直接跳到下一个括号
         brace_count = 1
         pos = brace_start + 1
         
-        while pos < len(content) and brace_count > 0:
-            if content[pos] == '{':
-                brace_count += 1
-            elif content[pos] == '}':
+        while brace_count > 0:
+            next_close = content.find('}', pos)
+            if next_close == -1:
+                # 括号不匹配，返回剩余全部内容
+                return content[brace_start + 1:].strip()
+            
+            next_open = content.find('{', pos, next_close)
+            if next_open == -1:
                 brace_count -= 1
-            pos += 1
+                pos = next_close + 1
+            else:
+                brace_count += 1
+                pos = next_open + 1
         
-        if brace_count == 0:
-            return content[brace_start + 1:pos - 1].strip()
-        else:
-            return content[brace_start + 1:].strip()
+        return content[brace_start + 1:pos - 1].strip()
     
     def _extract_target_function_from_test_name(self, test_name: str) -> str:
         """
@@ -345,33 +503,7 @@ class TestFileMatcher:
         Returns:
             str: 被测函数名
         """
-        # 移除常见的测试前缀和后缀
-        name = test_name.lower()
-        
-        # 移除 test_ 前缀
-        if name.startswith('test_'):
-            name = name[5:]
-        
-        # 移除 _test 后缀
-        if name.endswith('_test'):
-            name = name[:-5]
-        
-        # 处理 BDD 风格的测试名称 (如: function_When_Condition_Should_Result)
-        # 提取第一个 '_when' 或 '_should' 之前的部分
-        bdd_keywords = ['_when', '_should', '_given', '_then']
-        for keyword in bdd_keywords:
-            if keyword in name:
-                name = name.split(keyword)[0]
-                break
-        
-        # 移除常见的测试后缀
-        suffixes = ['_basic', '_simple', '_complex', '_edge_case', '_error', '_null', '_invalid']
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
-                break
-        
-        return name
+        return _target_function_name(test_name)
     
     def get_existing_tests_for_function(self, source_file_path: str, function_name: str) -> List[Dict[str, str]]:
         """
@@ -388,23 +520,8 @@ class TestFileMatcher:
         if not test_file:
             return []
         
-        all_tests = self.extract_test_functions(test_file)
-        
-        # 过滤出与指定函数相关的测试
-        related_tests = []
-        function_name_lower = function_name.lower()
-        
-        for test in all_tests:
-            target_func = test['target_function'].lower()
-            test_name_lower = test['name'].lower()
-            
-            # 检查是否匹配
-            if (target_func == function_name_lower or 
-                function_name_lower in test_name_lower or
-                target_func in function_name_lower):
-                related_tests.append(test)
-        
-        return related_tests
+        # 在解析阶段过滤，只为相关测试提取函数体
+        return self.extract_test_functions(test_file, name_filter=function_name)
     
     def get_test_context_summary(self, source_file_path: str, function_name: str) -> Dict[str, any]:
         """
@@ -444,23 +561,16 @@ class TestFileMatcher:
                 - name: 测试类名
                 - definition: 完整的类定义代码
         """
-        try:
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"读取测试文件失败 {test_file_path}: {e}")
+        # 复用 extract_test_functions 已读取并缓存的文件内容
+        parsed = self._scan_test_file(test_file_path)
+        if parsed is None:
             return []
         
+        content = parsed[0]
         test_classes = []
         
-        # 匹配Google Test fixture类的正则表达式
-        # 匹配格式: class ClassName : public ::testing::Test {
-        class_pattern = r'class\s+(\w+)\s*:\s*public\s+::testing::Test\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\};'
-        
-        matches = re.finditer(class_pattern, content, re.MULTILINE | re.DOTALL)
-        for match in matches:
+        for match in _TEST_CLASS_RE.finditer(content):
             class_name = match.group(1).strip()
-            class_body = match.group(2).strip()
             full_definition = match.group(0)
             
             test_classes.append({
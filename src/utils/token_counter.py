@@ -2,8 +2,10 @@
 Token counting utility for accurate LLM context size management
 """
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 import json
+import os
 
 
 try:
@@ -12,6 +14,70 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Approximate UTF-8 bytes per token when no encoder is available
+_BYTES_PER_TOKEN = 4
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _estimate_from_text(text: str) -> int:
+    """Estimate tokens from the UTF-8 byte length of text
+
+    Byte length tracks BPE behaviour better than character count for
+    non-ASCII text such as CJK comments; ASCII strings skip the encode.
+    """
+    if text.isascii():
+        byte_length = len(text)
+    else:
+        byte_length = len(text.encode('utf-8', errors='ignore'))
+    return byte_length // _BYTES_PER_TOKEN
+
+
+@lru_cache(maxsize=16)
+def _get_encoder(model: str):
+    """Get the tiktoken encoder for a model, shared across TokenCounter instances"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except (KeyError, ValueError):
+        # Fallback to cl100k_base for unknown models
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _collect_leaves(value: Any, leaves: List[str]) -> int:
+    """Flatten keys and scalar values into leaves, returning structural token overhead
+
+    Each container costs one token for its brackets and each entry one token
+    for its separator, approximating the JSON punctuation around the leaves.
+    """
+    if isinstance(value, dict):
+        leaves.extend(map(str, value))
+        overhead = 1 + len(value)
+        for item in value.values():
+            overhead += _collect_leaves(item, leaves)
+        return overhead
+    if isinstance(value, (list, tuple)):
+        overhead = 1 + len(value)
+        for item in value:
+            overhead += _collect_leaves(item, leaves)
+        return overhead
+    if isinstance(value, str):
+        leaves.append(value)
+    else:
+        leaves.append(json.dumps(value, default=str))
+    return 0
+
 
 class TokenCounter:
     """Accurate token counting for LLM context management"""
@@ -38,24 +104,33 @@ class TokenCounter:
         self.encoder = None
         
         if TIKTOKEN_AVAILABLE:
-            try:
-                self.encoder = tiktoken.encoding_for_model(model)
-            except (KeyError, ValueError):
-                # Fallback to cl100k_base for unknown models
-                self.encoder = tiktoken.get_encoding("cl100k_base")
+            self.encoder = _get_encoder(model)
     
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using appropriate encoder"""
         if self.encoder:
             return len(self.encoder.encode(text))
         else:
-            # Fallback: approximate token count (4 chars ≈ 1 token)
-            return len(text) // 4
+            # Fallback: approximate token count (4 UTF-8 bytes ≈ 1 token)
+            return _estimate_from_text(text)
     
     def count_tokens_from_dict(self, data: Dict[str, Any]) -> int:
-        """Count tokens from a dictionary by converting to JSON"""
-        json_text = json.dumps(data, ensure_ascii=False)
-        return self.count_tokens(json_text)
+        """Count tokens from a dictionary
+
+        With a tiktoken encoder the string leaves are encoded in one parallel
+        batch instead of serializing the whole dictionary to JSON first.
+        """
+        if self.encoder and hasattr(self.encoder, 'encode_batch'):
+            leaves: List[str] = []
+            structural_tokens = _collect_leaves(data, leaves)
+            encoded = self.encoder.encode_batch(leaves, num_threads=os.cpu_count() or 1)
+            return sum(map(len, encoded)) + structural_tokens
+
+        json_bytes = _dumps(data)
+        if self.encoder:
+            return self.count_tokens(json_bytes.decode('utf-8'))
+        # Fallback estimate works on the serialized bytes directly
+        return len(json_bytes) // _BYTES_PER_TOKEN
     
     def get_model_limit(self) -> int:
         """Get token limit for current provider and model"""
@@ -72,8 +147,8 @@ class TokenCounter:
     @staticmethod
     def estimate_tokens(text: str) -> int:
         """Static method for quick token estimation"""
-        # Simple estimation: 4 characters ≈ 1 token
-        return len(text) // 4
+        # Simple estimation: 4 UTF-8 bytes ≈ 1 token
+        return _estimate_from_text(text)
 
 
 def create_token_counter(llm_provider: str, llm_model: str) -> TokenCounter:
@@ -0,0 +1,118 @@
+
+#include <gtest/gtest.h>
+#include <cache.h>
+
+// **TARGET_FUNCTION**: lru_cache_create
+
+TEST(LRUCacheTest, CreateCache) {
+    const size_t max_size = 10;
+    lru_cache_t* cache = lru_cache_create(max_size);
+
+    ASSERT_NE(cache, nullptr);
+
+    // 清理
+    lru_cache_destroy(cache);
+}
+
+// **TARGET_FUNCTION**: lru_cache_put
+
+TEST(LRUCacheTest, PutAndGet) {
+    const size_t max_size = 10;
+    lru_cache_t* cache = lru_cache_create(max_size);
+    ASSERT_NE(cache, nullptr);
+
+    // 插入值
+    int value = 42;
+    EXPECT_TRUE(lru_cache_put(cache, "test_key", &value));
+
+    // 获取值
+    int* retrieved = (int*)lru_cache_get(cache, "test_key");
+    ASSERT_NE(retrieved, nullptr);
+    EXPECT_EQ(*retrieved, 42);
+
+    // 清理
+    lru_cache_destroy(cache);
+}
+
+// **TARGET_FUNCTION**: lru_cache_get
+
+TEST(LRUCacheTest, GetNonExistent) {
+    const size_t max_size = 10;
+    lru_cache_t* cache = lru_cache_create(max_size);
+    ASSERT_NE(cache, nullptr);
+
+    // 获取不存在的键
+    void* result = lru_cache_get(cache, "non_existent");
+    EXPECT_EQ(result, nullptr);
+
+    // 清理
+    lru_cache_destroy(cache);
+}
+
+// **TARGET_FUNCTION**: lru_cache_size (通过 hash_table_size)
+
+TEST(LRUCacheTest, CacheSize) {
+    const size_t max_size = 10;
+    lru_cache_t* cache = lru_cache_create(max_size);
+    ASSERT_NE(cache, nullptr);
+
+    // 初始大小应该是 0
+    EXPECT_EQ(lru_cache_size(cache), 0);
+
+    // 插入一些值
+    int values[] = {1, 2, 3};
+    EXPECT_TRUE(lru_cache_put(cache, "key1", &values[0]));
+    EXPECT_TRUE(lru_cache_put(cache, "key2", &values[1]));
+    EXPECT_TRUE(lru_cache_put(cache, "key3", &values[2]));
+
+    // 大小应该增加
+    EXPECT_EQ(lru_cache_size(cache), 3);
+
+    // 清理
+    lru_cache_destroy(cache);
+}
+
+// 测试边界情况
+TEST(LRUCacheTest, PutNullKey) {
+    const size_t max_size = 10;
+    lru_cache_t* cache = lru_cache_create(max_size);
+    ASSERT_NE(cache, nullptr);
+
+    // 尝试插入空键
+    int value = 42;
+    EXPECT_FALSE(lru_cache_put(cache, NULL, &value));
+
+    // 清理
+    lru_cache_destroy(cache);
+}
+
+// 测试覆写现有值
+TEST(LRUCacheTest, OverwriteValue) {
+    const size_t max_size = 10;
+    lru_cache_t* cache = lru_cache_create(max_size);
+    ASSERT_NE(cache, nullptr);
+
+    // 插入初始值
+    int value1 = 42;
+    EXPECT_TRUE(lru_cache_put(cache, "test_key", &value1));
+
+    // 获取并验证
+    int* retrieved = (int*)lru_cache_get(cache, "test_key");
+    ASSERT_NE(retrieved, nullptr);
+    EXPECT_EQ(*retrieved, 42);
+
+    // 覆写值
+    int value2 = 100;
+    EXPECT_TRUE(lru_cache_put(cache, "test_key", &value2));
+
+    // 获取新值
+    retrieved = (int*)lru_cache_get(cache, "test_key");
+    ASSERT_NE(retrieved, nullptr);
+    EXPECT_EQ(*retrieved, 100);
+
+    // 大小应该仍然是 1
+    EXPECT_EQ(lru_cache_size(cache), 1);
+
+    // 清理
+    lru_cache_destroy(cache);
+}
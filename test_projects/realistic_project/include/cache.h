@@ -0,0 +1,25 @@
+
+#ifndef CACHE_H
+#define CACHE_H
+
+#include "hash.h"
+#include "list.h"
+#include <time.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct lru_cache lru_cache_t;
+
+lru_cache_t* lru_cache_create(size_t max_size);
+void lru_cache_destroy(lru_cache_t* cache);
+bool lru_cache_put(lru_cache_t* cache, const char* key, void* value);
+void* lru_cache_get(lru_cache_t* cache, const char* key);
+size_t lru_cache_size(lru_cache_t* cache);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // CACHE_H
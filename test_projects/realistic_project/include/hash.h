@@ -0,0 +1,42 @@
+
+#ifndef HASH_H
+#define HASH_H
+
+#include <stddef.h>
+#include <stdbool.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct hash_table hash_table_t;
+
+// 创建哈希表
+hash_table_t* hash_table_create(size_t capacity);
+
+// 销毁哈希表
+void hash_table_destroy(hash_table_t* table);
+
+// 插入键值对
+bool hash_table_insert(hash_table_t* table, const char* key, void* value);
+
+// 查找值
+void* hash_table_get(hash_table_t* table, const char* key);
+
+// 删除键值对
+bool hash_table_remove(hash_table_t* table, const char* key);
+
+// 获取大小
+size_t hash_table_size(hash_table_t* table);
+
+// 检查是否存在
+bool hash_table_contains(hash_table_t* table, const char* key);
+
+// 清空表
+void hash_table_clear(hash_table_t* table);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // HASH_H
@@ -0,0 +1,45 @@
+
+#ifndef LIST_H
+#define LIST_H
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct list list_t;
+typedef struct list_node list_node_t;
+
+// 创建列表
+list_t* list_create(void);
+
+// 销毁列表
+void list_destroy(list_t* list);
+
+// 添加元素到头部
+bool list_push_front(list_t* list, void* data);
+
+// 添加元素到尾部
+bool list_push_back(list_t* list, void* data);
+
+// 移除头部元素
+void* list_pop_front(list_t* list);
+
+// 移除尾部元素
+void* list_pop_back(list_t* list);
+
+// 获取列表大小
+size_t list_size(list_t* list);
+
+// 检查是否为空
+bool list_empty(list_t* list);
+
+// 清空列表
+void list_clear(list_t* list);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // LIST_H
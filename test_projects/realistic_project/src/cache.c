@@ -0,0 +1,105 @@
+
+#include "hash.h"
+#include "list.h"
+#include <stdio.h>
+#include <time.h>
+
+typedef struct {
+    char* key;
+    void* value;
+    time_t timestamp;
+    int access_count;
+} cache_entry_t;
+
+typedef struct {
+    hash_table_t* table;
+    list_t* lru_list;
+    size_t max_size;
+} lru_cache_t;
+
+lru_cache_t* lru_cache_create(size_t max_size) {
+    lru_cache_t* cache = malloc(sizeof(lru_cache_t));
+    if (!cache) return NULL;
+
+    cache->table = hash_table_create(max_size * 2);
+    if (!cache->table) {
+        free(cache);
+        return NULL;
+    }
+
+    cache->lru_list = list_create();
+    if (!cache->lru_list) {
+        hash_table_destroy(cache->table);
+        free(cache);
+        return NULL;
+    }
+
+    cache->max_size = max_size;
+    return cache;
+}
+
+void lru_cache_destroy(lru_cache_t* cache) {
+    if (!cache) return;
+
+    // 清理所有条目
+    // ... 实现省略
+
+    hash_table_destroy(cache->table);
+    list_destroy(cache->lru_list);
+    free(cache);
+}
+
+bool lru_cache_put(lru_cache_t* cache, const char* key, void* value) {
+    if (!cache || !key) return false;
+
+    // 检查是否已存在
+    cache_entry_t* entry = (cache_entry_t*)hash_table_get(cache->table, key);
+    if (entry) {
+        entry->value = value;
+        entry->timestamp = time(NULL);
+        entry->access_count++;
+        return true;
+    }
+
+    // 检查是否需要驱逐
+    if (hash_table_size(cache->table) >= cache->max_size) {
+        // 简化：不实现 LRU 驱逐
+        return false;
+    }
+
+    // 创建新条目
+    entry = malloc(sizeof(cache_entry_t));
+    if (!entry) return false;
+
+    entry->key = malloc(strlen(key) + 1);
+    if (!entry->key) {
+        free(entry);
+        return false;
+    }
+
+    strcpy(entry->key, key);
+    entry->value = value;
+    entry->timestamp = time(NULL);
+    entry->access_count = 1;
+
+    if (!hash_table_insert(cache->table, key, entry)) {
+        free(entry->key);
+        free(entry);
+        return false;
+    }
+
+    return true;
+}
+
+void* lru_cache_get(lru_cache_t* cache, const char* key) {
+    if (!cache || !key) return NULL;
+
+    cache_entry_t* entry = (cache_entry_t*)hash_table_get(cache->table, key);
+    if (entry) {
+        entry->timestamp = time(NULL);
+        entry->access_count++;
+        return entry->value;
+    }
+
+    return NULL;
+}
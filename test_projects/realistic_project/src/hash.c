@@ -0,0 +1,190 @@
+
+#include "hash.h"
+#include <stdlib.h>
+#include <string.h>
+#include <stdio.h>
+
+#define HASH_TABLE_DEFAULT_LOAD_FACTOR 0.75
+
+typedef struct entry {
+    char* key;
+    void* value;
+    struct entry* next;
+} entry_t;
+
+struct hash_table {
+    size_t capacity;
+    size_t size;
+    entry_t** buckets;
+    size_t (*hash_func)(const char*);
+    bool (*key_equal)(const char*, const char*);
+};
+
+// djb2 hash algorithm
+static size_t default_hash_func(const char* str) {
+    unsigned long hash = 5381;
+    int c;
+    while ((c = *str++)) {
+        hash = ((hash << 5) + hash) + c;
+    }
+    return hash;
+}
+
+static bool default_key_equal(const char* a, const char* b) {
+    return strcmp(a, b) == 0;
+}
+
+hash_table_t* hash_table_create(size_t capacity) {
+    if (capacity == 0) {
+        capacity = 16;
+    }
+
+    hash_table_t* table = malloc(sizeof(hash_table_t));
+    if (!table) return NULL;
+
+    table->buckets = calloc(capacity, sizeof(entry_t*));
+    if (!table->buckets) {
+        free(table);
+        return NULL;
+    }
+
+    table->capacity = capacity;
+    table->size = 0;
+    table->hash_func = default_hash_func;
+    table->key_equal = default_key_equal;
+
+    return table;
+}
+
+void hash_table_destroy(hash_table_t* table) {
+    if (!table) return;
+
+    for (size_t i = 0; i < table->capacity; i++) {
+        entry_t* entry = table->buckets[i];
+        while (entry) {
+            entry_t* next = entry->next;
+            free(entry->key);
+            free(entry);
+            entry = next;
+        }
+    }
+
+    free(table->buckets);
+    free(table);
+}
+
+static entry_t* create_entry(const char* key, void* value) {
+    entry_t* entry = malloc(sizeof(entry_t));
+    if (!entry) return NULL;
+
+    entry->key = malloc(strlen(key) + 1);
+    if (!entry->key) {
+        free(entry);
+        return NULL;
+    }
+
+    strcpy(entry->key, key);
+    entry->value = value;
+    entry->next = NULL;
+
+    return entry;
+}
+
+bool hash_table_insert(hash_table_t* table, const char* key, void* value) {
+    if (!table || !key) return false;
+
+    // 检查是否需要扩容
+    if ((double)table->size / table->capacity > HASH_TABLE_DEFAULT_LOAD_FACTOR) {
+        // 简化：不实现扩容
+    }
+
+    size_t index = table->hash_func(key) % table->capacity;
+    entry_t* entry = table->buckets[index];
+
+    // 检查是否已存在
+    while (entry) {
+        if (table->key_equal(entry->key, key)) {
+            entry->value = value;
+            return true;
+        }
+        entry = entry->next;
+    }
+
+    // 创建新条目
+    entry_t* new_entry = create_entry(key, value);
+    if (!new_entry) return false;
+
+    new_entry->next = table->buckets[index];
+    table->buckets[index] = new_entry;
+    table->size++;
+
+    return true;
+}
+
+void* hash_table_get(hash_table_t* table, const char* key) {
+    if (!table || !key) return NULL;
+
+    size_t index = table->hash_func(key) % table->capacity;
+    entry_t* entry = table->buckets[index];
+
+    while (entry) {
+        if (table->key_equal(entry->key, key)) {
+            return entry->value;
+        }
+        entry = entry->next;
+    }
+
+    return NULL;
+}
+
+bool hash_table_remove(hash_table_t* table, const char* key) {
+    if (!table || !key) return false;
+
+    size_t index = table->hash_func(key) % table->capacity;
+    entry_t* entry = table->buckets[index];
+    entry_t* prev = NULL;
+
+    while (entry) {
+        if (table->key_equal(entry->key, key)) {
+            if (prev) {
+                prev->next = entry->next;
+            } else {
+                table->buckets[index] = entry->next;
+            }
+
+            free(entry->key);
+            free(entry);
+            table->size--;
+            return true;
+        }
+        prev = entry;
+        entry = entry->next;
+    }
+
+    return false;
+}
+
+size_t hash_table_size(hash_table_t* table) {
+    return table ? table->size : 0;
+}
+
+bool hash_table_contains(hash_table_t* table, const char* key) {
+    return hash_table_get(table, key) != NULL;
+}
+
+void hash_table_clear(hash_table_t* table) {
+    if (!table) return;
+
+    for (size_t i = 0; i < table->capacity; i++) {
+        entry_t* entry = table->buckets[i];
+        while (entry) {
+            entry_t* next = entry->next;
+            free(entry->key);
+            free(entry);
+            entry = next;
+        }
+        table->buckets[i] = NULL;
+    }
+
+    table->size = 0;
+}
@@ -0,0 +1,140 @@
+
+#include "list.h"
+#include <stdlib.h>
+
+struct list_node {
+    void* data;
+    struct list_node* next;
+    struct list_node* prev;
+};
+
+struct list {
+    list_node_t* head;
+    list_node_t* tail;
+    size_t size;
+};
+
+list_t* list_create(void) {
+    list_t* list = malloc(sizeof(list_t));
+    if (!list) return NULL;
+
+    list->head = NULL;
+    list->tail = NULL;
+    list->size = 0;
+
+    return list;
+}
+
+void list_destroy(list_t* list) {
+    if (!list) return;
+
+    list_clear(list);
+    free(list);
+}
+
+static list_node_t* create_node(void* data) {
+    list_node_t* node = malloc(sizeof(list_node_t));
+    if (!node) return NULL;
+
+    node->data = data;
+    node->next = NULL;
+    node->prev = NULL;
+
+    return node;
+}
+
+bool list_push_front(list_t* list, void* data) {
+    if (!list) return false;
+
+    list_node_t* node = create_node(data);
+    if (!node) return false;
+
+    node->next = list->head;
+    node->prev = NULL;
+
+    if (list->head) {
+        list->head->prev = node;
+    } else {
+        list->tail = node;
+    }
+
+    list->head = node;
+    list->size++;
+
+    return true;
+}
+
+bool list_push_back(list_t* list, void* data) {
+    if (!list) return false;
+
+    list_node_t* node = create_node(data);
+    if (!node) return false;
+
+    node->prev = list->tail;
+    node->next = NULL;
+
+    if (list->tail) {
+        list->tail->next = node;
+    } else {
+        list->head = node;
+    }
+
+    list->tail = node;
+    list->size++;
+
+    return true;
+}
+
+void* list_pop_front(list_t* list) {
+    if (!list || !list->head) return NULL;
+
+    list_node_t* node = list->head;
+    void* data = node->data;
+
+    list->head = node->next;
+    if (list->head) {
+        list->head->prev = NULL;
+    } else {
+        list->tail = NULL;
+    }
+
+    free(node);
+    list->size--;
+
+    return data;
+}
+
+void* list_pop_back(list_t* list) {
+    if (!list || !list->tail) return NULL;
+
+    list_node_t* node = list->tail;
+    void* data = node->data;
+
+    list->tail = node->prev;
+    if (list->tail) {
+        list->tail->next = NULL;
+    } else {
+        list->head = NULL;
+    }
+
+    free(node);
+    list->size--;
+
+    return data;
+}
+
+size_t list_size(list_t* list) {
+    return list ? list->size : 0;
+}
+
+bool list_empty(list_t* list) {
+    return list ? list->size == 0 : true;
+}
+
+void list_clear(list_t* list) {
+    if (!list) return;
+
+    while (list->head) {
+        list_pop_front(list);
+    }
+}
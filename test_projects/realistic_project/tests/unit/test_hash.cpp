@@ -0,0 +1,30 @@
+
+#include <gtest/gtest.h>
+#include <hash.h>
+
+class HashTest : public ::testing::Test {
+protected:
+    void SetUp() override {
+        table = hash_table_create(10);
+    }
+
+    void TearDown() override {
+        hash_table_destroy(table);
+    }
+
+    hash_table_t* table;
+};
+
+TEST_F(HashTest, CreateTable) {
+    EXPECT_NE(table, nullptr);
+    EXPECT_EQ(hash_table_size(table), 0);
+}
+
+TEST_F(HashTest, InsertAndGet) {
+    int value = 42;
+    EXPECT_TRUE(hash_table_insert(table, "key", &value));
+
+    int* retrieved = (int*)hash_table_get(table, "key");
+    EXPECT_NE(retrieved, nullptr);
+    EXPECT_EQ(*retrieved, 42);
+}
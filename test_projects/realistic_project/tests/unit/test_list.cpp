@@ -0,0 +1,22 @@
+
+#include <gtest/gtest.h>
+#include <list.h>
+
+class ListTest : public ::testing::Test {
+protected:
+    void SetUp() override {
+        list = list_create();
+    }
+
+    void TearDown() override {
+        list_destroy(list);
+    }
+
+    list_t* list;
+};
+
+TEST_F(ListTest, CreateList) {
+    EXPECT_NE(list, nullptr);
+    EXPECT_TRUE(list_empty(list));
+    EXPECT_EQ(list_size(list), 0);
+}
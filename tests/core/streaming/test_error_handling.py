@@ -6,16 +6,71 @@ These tests verify that components handle errors gracefully and recover properly
 
 import pytest
 import asyncio
-import tempfile
+import gc
+import random
+import tracemalloc
+from contextlib import AsyncExitStack
 from pathlib import Path
+from unittest.mock import AsyncMock
 
-from src.core.streaming.interfaces import StreamingConfiguration
+from src.core.streaming.interfaces import (
+    StreamStage, StreamPacket, StreamingConfiguration, FunctionStreamData
+)
 from src.core.streaming.file_discoverer import FileDiscoverer
 from src.core.streaming.function_processor import FunctionProcessor
 from src.core.streaming.llm_processor import LLMProcessor
 from src.core.streaming.result_collector import ResultCollector
 
 
+# Configuration variants shared by the validation tests, built once at import
+_INVALID_CONFIG_OPTIONS = (
+    {"max_queue_size": 0},
+    {"max_concurrent_files": 0},
+    {"max_concurrent_functions": 0},
+    {"max_concurrent_llm_calls": 0},
+    {"timeout_seconds": 0},
+    {"retry_attempts": -1},
+)
+
+# Minimum valid values
+_BOUNDARY_CONFIG_OPTIONS = (
+    {"max_queue_size": 1},
+    {"max_concurrent_files": 1},
+    {"max_concurrent_functions": 1},
+    {"max_concurrent_llm_calls": 1},
+    {"timeout_seconds": 1},
+    {"retry_attempts": 0},
+)
+
+# Just past the minimum valid values
+_INVALID_BOUNDARY_CONFIG_OPTIONS = (
+    {"max_queue_size": -1},
+    {"max_concurrent_files": -1},
+    {"max_concurrent_functions": -1},
+    {"max_concurrent_llm_calls": -1},
+    {"timeout_seconds": -1},
+    {"retry_attempts": -2},
+)
+
+# Extreme but valid values, alone and combined
+_EXTREME_CONFIG_OPTIONS = (
+    {"max_queue_size": 1000000},
+    {"max_concurrent_files": 1000},
+    {"max_concurrent_functions": 1000},
+    {"max_concurrent_llm_calls": 1000},
+    {"timeout_seconds": 3600},  # 1 hour
+    {"retry_attempts": 100},
+    {
+        "max_queue_size": 10000,
+        "max_concurrent_files": 100,
+        "max_concurrent_functions": 100,
+        "max_concurrent_llm_calls": 50,
+        "timeout_seconds": 600,
+        "retry_attempts": 10,
+    },
+)
+
+
 class FailingLLMClient:
     """LLM client that always fails"""
 
@@ -24,11 +79,12 @@ class FailingLLMClient:
         self.call_count = 0
         self.fail_on_call = fail_on_call
 
-    def generate_test(self, prompt: str, function_name: str) -> str:
+    def generate_test(self, prompt: str, max_tokens: int = 2000,
+                      temperature: float = 0.3, language: str = "c") -> str:
         self.call_count += 1
         if self.fail_on_call is None or self.call_count >= self.fail_on_call:
-            raise RuntimeError(f"Simulated failure for {function_name} (call #{self.call_count})")
-        return f"// Success for {function_name}"
+            raise RuntimeError(f"Simulated failure (call #{self.call_count})")
+        return "// Success"
 
 
 class UnreliableLLMClient:
@@ -39,22 +95,35 @@ class UnreliableLLMClient:
         self.failure_rate = failure_rate
         self.call_count = 0
 
-    def generate_test(self, prompt: str, function_name: str) -> str:
+    def generate_test(self, prompt: str, max_tokens: int = 2000,
+                      temperature: float = 0.3, language: str = "c") -> str:
         self.call_count += 1
-        import random
         if random.random() < self.failure_rate:
-            raise RuntimeError(f"Random failure for {function_name} (call #{self.call_count})")
-        return f"// Success for {function_name}"
+            raise RuntimeError(f"Random failure (call #{self.call_count})")
+        return "// Success"
+
+
+# Failure scenarios for the recovery tests; clients are built per test case
+_FAILURE_SCENARIOS = (
+    pytest.param(lambda: FailingLLMClient(fail_on_call=1), id="fails-immediately"),
+    pytest.param(lambda: FailingLLMClient(fail_on_call=3), id="fails-after-some-calls"),
+    pytest.param(lambda: UnreliableLLMClient(failure_rate=1.0), id="always-fails"),
+    pytest.param(lambda: UnreliableLLMClient(failure_rate=0.5), id="sometimes-fails"),
+)
 
 
 class TestErrorHandling:
     """Error handling and resilience tests"""
 
+    @pytest.fixture(autouse=True)
+    def _fast_sleep(self, monkeypatch):
+        """Make retry backoff and rate-limit waits return immediately"""
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
     @pytest.fixture
-    def temp_output_dir(self):
-        """Create temporary output directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+    def temp_output_dir(self, tmp_path):
+        """Per-test output directory under pytest's session temp root"""
+        return str(tmp_path)
 
     @pytest.fixture
     def config(self):
@@ -91,32 +160,24 @@ class TestErrorHandling:
         # For now, just test it doesn't crash
         await processor.cleanup()
 
-    @pytest.mark.asyncio
-    async def test_component_creation_with_invalid_config(self):
+    @pytest.mark.parametrize("config_options", _INVALID_CONFIG_OPTIONS)
+    def test_component_creation_with_invalid_config(self, config_options):
         """Test component creation with invalid configurations"""
-        invalid_configs = [
-            StreamingConfiguration(max_queue_size=0),
-            StreamingConfiguration(max_concurrent_files=0),
-            StreamingConfiguration(max_concurrent_functions=0),
-            StreamingConfiguration(max_concurrent_llm_calls=0),
-            StreamingConfiguration(timeout_seconds=0),
-            StreamingConfiguration(retry_attempts=-1)
-        ]
+        invalid_config = StreamingConfiguration(**config_options)
 
-        for invalid_config in invalid_configs:
-            # Validation should fail
-            with pytest.raises(ValueError):
-                invalid_config.validate()
-
-            # Components should be created with config (validation happens at usage time)
-            # This is a design choice - components validate when needed, not at creation
-            try:
-                discoverer = FileDiscoverer(config=invalid_config)
-                processor = FunctionProcessor(config=invalid_config)
-                # Components are created, but validation will fail when used
-            except ValueError:
-                # If validation happens at creation, that's also acceptable
-                pass
+        # Validation should fail
+        with pytest.raises(ValueError):
+            invalid_config.validate()
+
+        # Components should be created with config (validation happens at usage time)
+        # This is a design choice - components validate when needed, not at creation
+        try:
+            discoverer = FileDiscoverer(config=invalid_config)
+            processor = FunctionProcessor(config=invalid_config)
+            # Components are created, but validation will fail when used
+        except ValueError:
+            # If validation happens at creation, that's also acceptable
+            pass
 
     @pytest.mark.asyncio
     async def test_component_cleanup_after_error(self, config, temp_output_dir):
@@ -131,67 +192,53 @@ class TestErrorHandling:
         ]
 
         # All components should be cleanable even after errors
-        for component in components:
-            try:
-                await component.cleanup()
-            except Exception as e:
-                pytest.fail(f"Component cleanup failed: {e}")
-
-    def test_configuration_validation_edge_cases(self):
-        """Test configuration validation edge cases"""
-        # Test boundary values
-        boundary_configs = [
-            StreamingConfiguration(max_queue_size=1),  # Minimum valid
-            StreamingConfiguration(max_concurrent_files=1),  # Minimum valid
-            StreamingConfiguration(max_concurrent_functions=1),  # Minimum valid
-            StreamingConfiguration(max_concurrent_llm_calls=1),  # Minimum valid
-            StreamingConfiguration(timeout_seconds=1),  # Minimum valid
-            StreamingConfiguration(retry_attempts=0),  # Minimum valid
-        ]
-
-        for config in boundary_configs:
-            # Should not raise for valid boundary values
-            config.validate()
-
-        # Test slightly invalid boundary values
-        invalid_boundary_configs = [
-            StreamingConfiguration(max_queue_size=-1),
-            StreamingConfiguration(max_concurrent_files=-1),
-            StreamingConfiguration(max_concurrent_functions=-1),
-            StreamingConfiguration(max_concurrent_llm_calls=-1),
-            StreamingConfiguration(timeout_seconds=-1),
-            StreamingConfiguration(retry_attempts=-2),
-        ]
-
-        for invalid_config in invalid_boundary_configs:
-            # Should raise for invalid boundary values
-            with pytest.raises(ValueError):
-                invalid_config.validate()
+        results = await asyncio.gather(
+            *(component.cleanup() for component in components),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                pytest.fail(f"Component cleanup failed: {result}")
+
+    @pytest.mark.parametrize("config_options", _BOUNDARY_CONFIG_OPTIONS)
+    def test_configuration_validation_edge_cases(self, config_options):
+        """Test configuration validation accepts minimum valid values"""
+        # Should not raise for valid boundary values
+        StreamingConfiguration(**config_options).validate()
+
+    @pytest.mark.parametrize("config_options", _INVALID_BOUNDARY_CONFIG_OPTIONS)
+    def test_configuration_validation_invalid_edge_cases(self, config_options):
+        """Test configuration validation rejects values just past the boundary"""
+        with pytest.raises(ValueError):
+            StreamingConfiguration(**config_options).validate()
 
     @pytest.mark.asyncio
     async def test_resource_cleanup_on_errors(self, config, temp_output_dir):
         """Test resource cleanup when errors occur"""
         failing_client = FailingLLMClient()
 
-        # Create components
-        discoverer = FileDiscoverer(config=config)
-        processor = FunctionProcessor(config=config)
-        llm_processor = LLMProcessor(config=config, llm_client=failing_client)
-        collector = ResultCollector(config=config, output_dir=temp_output_dir)
-
-        # Simulate error scenarios and ensure cleanup still works
-        components = [discoverer, processor, llm_processor, collector]
+        # Register each cleanup as soon as its component exists, so components that
+        # were created are still cleaned up if a later step raises
+        async with AsyncExitStack() as stack:
+            discoverer = FileDiscoverer(config=config)
+            stack.push_async_callback(discoverer.cleanup)
+            processor = FunctionProcessor(config=config)
+            stack.push_async_callback(processor.cleanup)
+            llm_processor = LLMProcessor(config=config, llm_client=failing_client)
+            stack.push_async_callback(llm_processor.cleanup)
+            collector = ResultCollector(config=config, output_dir=temp_output_dir)
+            stack.push_async_callback(collector.cleanup)
 
-        for component in components:
-            try:
-                # Simulate some operation that might fail
-                if hasattr(component, 'processed_count'):
-                    _ = component.processed_count
-            except Exception:
-                pass  # Ignore errors for this test
+            components = [discoverer, processor, llm_processor, collector]
 
-            # Cleanup should still work
-            await component.cleanup()
+            # Simulate error scenarios and ensure cleanup still works
+            for component in components:
+                try:
+                    # Simulate some operation that might fail
+                    if hasattr(component, 'processed_count'):
+                        _ = component.processed_count
+                except Exception:
+                    pass  # Ignore errors for this test
 
     def test_error_propagation_isolation(self, config):
         """Test that errors in one component don't affect others"""
@@ -217,45 +264,67 @@ class TestErrorHandling:
     async def test_concurrent_error_handling(self, config):
         """Test error handling in concurrent scenarios"""
         failing_client = FailingLLMClient()
+        processor = LLMProcessor(config=config, llm_client=failing_client)
 
-        # Create multiple components that might fail concurrently
-        components = [
-            LLMProcessor(config=config, llm_client=failing_client)
-            for _ in range(5)
+        function_packets = [
+            StreamPacket(
+                stage=StreamStage.LLM_PROCESSING,
+                data={
+                    "function_stream_data": FunctionStreamData(
+                        file_path="test.c",
+                        function_info={
+                            "name": f"function_{i}",
+                            "signature": f"int function_{i}(void)",
+                            "return_type": "int",
+                            "parameters": [],
+                            "body": "{ return 0; }",
+                            "location": "test.c:1",
+                            "file": "test.c",
+                            "line": 1,
+                            "language": "c"
+                        },
+                        compile_args=[]
+                    )
+                },
+                timestamp=1234567890.0,
+                packet_id=f"func-{i}"
+            )
+            for i in range(5)
         ]
 
-        # All components should be created successfully
-        assert len(components) == 5
+        # One processor handles all functions through its semaphore-bounded path;
+        # every generation fails, so no result packets come out
+        results = [
+            packet async for packet in processor._process_functions_concurrent(function_packets)
+        ]
+        assert results == []
+        attempts = len(function_packets) * (config.retry_attempts + 1)
+        assert failing_client.call_count == attempts
+        assert processor.metrics.failed_requests == attempts
 
-        # All components should be cleanable concurrently
-        cleanup_tasks = [component.cleanup() for component in components]
-        await asyncio.gather(*cleanup_tasks, return_exceptions=True)
+        await processor.cleanup()
 
     def test_memory_leak_prevention(self, config):
         """Test that error scenarios don't cause memory leaks"""
-        import gc
-        import weakref
-
         failing_client = FailingLLMClient()
 
-        # Create and destroy components in error scenarios
-        for _ in range(10):
-            try:
-                component = LLMProcessor(config=config, llm_client=failing_client)
-                # Create weak reference to track cleanup
-                ref = weakref.ref(component)
-                del component
-                gc.collect()
-                # Component should be garbage collectable
-                # (Note: weakref might still exist due to circular references)
-            except Exception:
-                pass
-
-        # Force garbage collection
+        # Warm up once so lazy imports and shared caches are not counted as leaks
+        LLMProcessor(config=config, llm_client=failing_client)
         gc.collect()
 
-        # If we get here without memory errors, basic leak prevention is working
-        assert True
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            # Create and drop components in error scenarios
+            for _ in range(100):
+                LLMProcessor(config=config, llm_client=failing_client)
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+
+        # Dropped components should be garbage collectable
+        assert retained < 64 * 1024
 
     @pytest.mark.asyncio
     async def test_timeout_handling(self):
@@ -290,61 +359,26 @@ class TestErrorHandling:
             assert isinstance(e, (ValueError, TypeError, AttributeError))
 
     @pytest.mark.asyncio
-    async def test_error_recovery_patterns(self, config, temp_output_dir):
+    @pytest.mark.parametrize("make_client", _FAILURE_SCENARIOS)
+    async def test_error_recovery_patterns(self, config, make_client):
         """Test various error recovery patterns"""
-        # Test different failure scenarios
-        failure_scenarios = [
-            FailingLLMClient(fail_on_call=1),  # Fails immediately
-            FailingLLMClient(fail_on_call=3),  # Fails after some calls
-            UnreliableLLMClient(failure_rate=1.0),  # Always fails
-            UnreliableLLMClient(failure_rate=0.5),  # Sometimes fails
-        ]
-
-        for i, failing_client in enumerate(failure_scenarios):
-            try:
-                processor = LLMProcessor(config=config, llm_client=failing_client)
-                # Should be able to create processor
-                assert processor is not None
+        try:
+            processor = LLMProcessor(config=config, llm_client=make_client())
+            # Should be able to create processor
+            assert processor is not None
 
-                # Should be able to cleanup
-                await processor.cleanup()
+            # Should be able to cleanup
+            await processor.cleanup()
 
-            except Exception as e:
-                # Should handle errors gracefully
-                print(f"Error recovery pattern {i}: {type(e).__name__}: {e}")
-                # Should not crash completely
-                assert True
+        except Exception:
+            # Should handle errors gracefully, not crash completely
+            pass
 
-    def test_configuration_robustness(self):
+    @pytest.mark.parametrize("config_options", _EXTREME_CONFIG_OPTIONS)
+    def test_configuration_robustness(self, config_options):
         """Test configuration robustness with extreme values"""
-        # Test with extreme but valid values
-        extreme_configs = [
-            StreamingConfiguration(max_queue_size=1000000),
-            StreamingConfiguration(max_concurrent_files=1000),
-            StreamingConfiguration(max_concurrent_functions=1000),
-            StreamingConfiguration(max_concurrent_llm_calls=1000),
-            StreamingConfiguration(timeout_seconds=3600),  # 1 hour
-            StreamingConfiguration(retry_attempts=100),
-        ]
-
-        for config in extreme_configs:
-            try:
-                config.validate()  # Should validate successfully
-            except Exception as e:
-                # If validation fails, it should be for a good reason
-                assert isinstance(e, ValueError)
-
-        # Test with combinations of extreme values
         try:
-            extreme_combo_config = StreamingConfiguration(
-                max_queue_size=10000,
-                max_concurrent_files=100,
-                max_concurrent_functions=100,
-                max_concurrent_llm_calls=50,
-                timeout_seconds=600,
-                retry_attempts=10
-            )
-            extreme_combo_config.validate()
+            StreamingConfiguration(**config_options).validate()  # Should validate successfully
         except Exception as e:
-            # Should handle extreme combinations gracefully
-            assert isinstance(e, ValueError)
\ No newline at end of file
+            # If validation fails, it should be for a good reason
+            assert isinstance(e, ValueError)
@@ -7,6 +7,7 @@ These tests define expected behavior before implementation.
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
+from types import MappingProxyType
 from typing import AsyncIterator
 
 from src.core.streaming.interfaces import (
@@ -15,9 +16,26 @@ from src.core.streaming.interfaces import (
 )
 
 
+def _mock_functions(language: str) -> tuple:
+    """Build the read-only mock functions reported for every file of a language"""
+    return tuple(
+        MappingProxyType({
+            "name": f"test_function_{i}",
+            "return_type": "int",
+            "parameters": (),
+            "body": f"return {i};",
+            "is_static": False,
+            "language": language
+        })
+        for i in range(1, 4)  # Mock 3 functions per file
+    )
+
+
 class MockFunctionProcessor(StreamProcessor):
     """Mock FunctionProcessor for testing interface compliance"""
 
+    _MOCK_FUNCTIONS = {"c": _mock_functions("c"), "cpp": _mock_functions("cpp")}
+
     def __init__(self, should_fail: bool = False):
         self.should_fail = should_fail
         self.processed_functions = []
@@ -33,18 +51,8 @@ class MockFunctionProcessor(StreamProcessor):
         if not file_path:
             return
 
-        # Mock function discovery
-        mock_functions = [
-            {
-                "name": f"test_function_{i}",
-                "return_type": "int",
-                "parameters": [],
-                "body": f"return {i};",
-                "is_static": False,
-                "language": "c" if file_path.endswith('.c') else "cpp"
-            }
-            for i in range(1, 4)  # Mock 3 functions per file
-        ]
+        # Mock function discovery: 3 prebuilt, read-only functions per file
+        mock_functions = self._MOCK_FUNCTIONS["c" if file_path.endswith('.c') else "cpp"]
 
         for func_data in mock_functions:
             self.processed_functions.append(func_data)
@@ -204,14 +212,15 @@ class TestFunctionProcessor:
         # This test will drive implementation of AST caching
         pytest.skip("AST caching implementation pending")
 
-    def test_function_processor_immutability(self, file_packet):
+    @pytest.mark.asyncio
+    async def test_function_processor_immutability(self, file_packet):
         """Test that function processing doesn't modify input packets"""
         processor = MockFunctionProcessor()
 
         original_data = file_packet.data.copy()
 
-        # Process synchronously to test immutability
-        asyncio.run(processor.process(file_packet).__anext__())
+        # Process one packet on the test's event loop to test immutability
+        await processor.process(file_packet).__anext__()
 
         # Original packet should be unchanged
         assert file_packet.data == original_data
@@ -236,15 +236,12 @@ class TestStreamingPipelineOrchestrator:
         """Test pipeline performance characteristics"""
         orchestrator = MockStreamingPipelineOrchestrator(config)
 
-        start_time = asyncio.get_event_loop().time()
-        results = []
-        async for packet in orchestrator.execute_streaming(sample_compilation_units):
-            results.append(packet)
-        end_time = asyncio.get_event_loop().time()
+        async def collect():
+            return [packet async for packet in orchestrator.execute_streaming(sample_compilation_units)]
 
-        processing_time = end_time - start_time
+        # Should complete quickly for mock; a hang is cancelled at the deadline
+        results = await asyncio.wait_for(collect(), timeout=1.0)
 
         # Basic performance assertions
-        assert processing_time < 1.0  # Should complete quickly for mock
         assert len(results) == 4
         assert len(orchestrator.processed_packets) == 4
\ No newline at end of file
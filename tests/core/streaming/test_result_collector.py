@@ -286,14 +286,15 @@ TEST(MathTestSuite, CalculateSumTest) {
         # This test will drive implementation of real file saving
         pytest.skip("Real file operations implementation pending")
 
-    def test_result_collector_immutability(self, result_packet):
+    @pytest.mark.asyncio
+    async def test_result_collector_immutability(self, result_packet):
         """Test that result collection doesn't modify input packets"""
         collector = MockResultCollector()
 
         original_data = result_packet.data.copy()
 
-        # Process synchronously to test immutability
-        asyncio.run(collector.process(result_packet).__anext__())
+        # Process one packet on the test's event loop to test immutability
+        await collector.process(result_packet).__anext__()
 
         # Original packet should be unchanged
         assert result_packet.data == original_data
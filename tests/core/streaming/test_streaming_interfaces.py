@@ -6,6 +6,8 @@ These tests define the expected behavior of streaming components before implemen
 
 import pytest
 import asyncio
+import pickle
+import sys
 from unittest.mock import AsyncMock, MagicMock
 from typing import AsyncIterator
 
@@ -105,6 +107,19 @@ class TestFunctionStreamData:
         assert new_data.function_info == original.function_info
         assert new_data.compile_args == original.compile_args
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_function_stream_data_has_no_instance_dict(self):
+        """Test that per-function data is slotted and survives copying"""
+        data = FunctionStreamData(
+            file_path="test.c",
+            function_info={"name": "test"},
+            compile_args=["-O2"],
+            priority=2
+        )
+
+        assert not hasattr(data, "__dict__")
+        assert pickle.loads(pickle.dumps(data)) == data
+
 
 class TestStreamingConfiguration:
     """Test StreamingConfiguration validation and behavior"""
@@ -4,6 +4,7 @@ Test script to demonstrate context extraction for LLM test generation
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
@@ -17,14 +18,21 @@ from src.parser.compilation_db import CompilationDatabaseParser
 from src.analyzer.function_analyzer import FunctionAnalyzer
 from src.utils.context_compressor import ContextCompressor
 
+COMP_DB_PATH = "test_projects/complex_c_project/compile_commands.json"
+
+
+@lru_cache(maxsize=None)
+def _load_compilation_units(comp_db_path):
+    """Parse the compilation database once and share it across tests"""
+    return tuple(CompilationDatabaseParser(comp_db_path).parse())
+
+
 def test_context_extraction():
     """Test context extraction for LLM test generation"""
     print("=== Testing Context Extraction for LLM ===")
     
     # Test with C project
-    comp_db_path = "test_projects/complex_c_project/compile_commands.json"
-    parser = CompilationDatabaseParser(comp_db_path)
-    compilation_units = parser.parse()
+    compilation_units = list(_load_compilation_units(COMP_DB_PATH))
     
     analyzer = FunctionAnalyzer("test_projects/complex_c_project")
     compressor = ContextCompressor()
@@ -64,9 +72,7 @@ def test_specific_function():
     """Test context extraction for a specific function"""
     print("\n=== Testing Specific Function ===")
     
-    comp_db_path = "test_projects/complex_c_project/compile_commands.json"
-    parser = CompilationDatabaseParser(comp_db_path)
-    compilation_units = parser.parse()
+    compilation_units = list(_load_compilation_units(COMP_DB_PATH))
     
     analyzer = FunctionAnalyzer("test_projects/complex_c_project")
     compressor = ContextCompressor()
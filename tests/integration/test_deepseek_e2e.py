@@ -196,7 +196,7 @@ TEST(MultiplyTest, Zero) {
 
         print(f"✓ LLM客户端测试成功，生成了测试代码")
 
-    def test_deepseek_with_test_generation_service(self, deepseek_api_key, sample_functions):
+    def test_deepseek_with_test_generation_service(self, deepseek_api_key, sample_functions, tmp_path):
         """测试完整的测试生成服务流程"""
         # 创建Mock LLM客户端
         mock_client = Mock(spec=LLMClient)
@@ -226,7 +226,7 @@ TEST(FunctionTest, BasicCase) {{
         # 创建配置
         config = TestGenerationConfig(
             project_name="deepseek_e2e_test",
-            output_dir=tempfile.mkdtemp(),
+            output_dir=str(tmp_path),
             max_workers=1,  # 使用单线程避免API限制
             save_prompts=True,
             aggregate_tests=True,
@@ -437,7 +437,7 @@ TEST(FunctionTest, BasicCase) {{
         finally:
             os.unlink(config_file)
 
-    def test_deepseek_with_real_project_structure(self, deepseek_api_key):
+    def test_deepseek_with_real_project_structure(self, deepseek_api_key, tmp_path):
         """测试使用真实项目结构进行端到端测试"""
         # 创建临时的项目结构
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -497,7 +497,7 @@ TEST(MathUtilsTest, CalculateCircleArea) {
 
             config = TestGenerationConfig(
                 project_name="real_structure_test",
-                output_dir=tempfile.mkdtemp(),
+                output_dir=str(tmp_path),
                 max_workers=1,
                 save_prompts=True,
                 aggregate_tests=True
@@ -102,7 +102,7 @@ class TestEndToEndPipeline:
             }
         ]
     
-    def test_complete_pipeline_with_mock_llm(self):
+    def test_complete_pipeline_with_mock_llm(self, tmp_path):
         """Test complete pipeline using mock LLM client"""
         # Create mock LLM client
         mock_client = LLMClient.create_mock_client("test-model")
@@ -113,7 +113,7 @@ class TestEndToEndPipeline:
         # Create test configuration
         config = TestGenerationConfig(
             project_name="test_project",
-            output_dir=tempfile.mkdtemp(),
+            output_dir=str(tmp_path),
             max_workers=1,
             save_prompts=True,
             aggregate_tests=True,
@@ -141,7 +141,7 @@ class TestEndToEndPipeline:
             assert hasattr(test_result, 'success')
             assert test_result.task.function_name in ['add_numbers', 'multiply']
     
-    def test_backward_compatible_api(self):
+    def test_backward_compatible_api(self, tmp_path):
         """Test backward compatible API works correctly"""
         # Create mock LLM client
         mock_client = LLMClient.create_mock_client("test-model")
@@ -152,7 +152,7 @@ class TestEndToEndPipeline:
         # Create project config in old format
         project_config = {
             'name': 'test_project',
-            'output_dir': tempfile.mkdtemp(),
+            'output_dir': str(tmp_path),
             'llm_provider': 'mock',
             'model': 'test-model',
             'max_workers': 1
@@ -224,7 +224,7 @@ class TestEndToEndPipeline:
         llm_config = service.create_llm_config_from_dict(project_config)
         assert llm_config.provider_name == 'deepseek'  # Default
     
-    def test_error_handling_integration(self):
+    def test_error_handling_integration(self, tmp_path):
         """Test error handling in the complete pipeline"""
         # Create service with mock that always fails
         mock_client = Mock(spec=LLMClient)
@@ -245,7 +245,7 @@ class TestEndToEndPipeline:
         # Create configuration
         config = TestGenerationConfig(
             project_name="error_test",
-            output_dir=tempfile.mkdtemp(),
+            output_dir=str(tmp_path),
             max_workers=1
         )
         
@@ -266,7 +266,7 @@ class TestEndToEndPipeline:
             assert test_result.success is False
             assert test_result.error is not None
     
-    def test_sequential_vs_concurrent_execution(self):
+    def test_sequential_vs_concurrent_execution(self, tmp_path):
         """Test both sequential and concurrent execution strategies"""
         mock_client = LLMClient.create_mock_client("test-model")
         service = TestGenerationService(llm_client=mock_client)
@@ -275,7 +275,7 @@ class TestEndToEndPipeline:
         # Test sequential execution
         sequential_config = TestGenerationConfig(
             project_name="sequential_test",
-            output_dir=tempfile.mkdtemp(),
+            output_dir=str(tmp_path / "sequential"),
             max_workers=1,  # Forces sequential
             execution_strategy="sequential"
         )
@@ -286,7 +286,7 @@ class TestEndToEndPipeline:
         # Test concurrent execution
         concurrent_config = TestGenerationConfig(
             project_name="concurrent_test", 
-            output_dir=tempfile.mkdtemp(),
+            output_dir=str(tmp_path / "concurrent"),
             max_workers=2,  # Forces concurrent
             execution_strategy="concurrent"
         )
@@ -340,13 +340,13 @@ class TestEndToEndPipeline:
         finally:
             os.unlink(config_file)
     
-    def test_output_directory_creation(self):
+    def test_output_directory_creation(self, tmp_path):
         """Test output directory creation and file organization"""
         mock_client = LLMClient.create_mock_client("test-model")
         service = TestGenerationService(llm_client=mock_client)
         
         # Use a specific temporary directory
-        base_output_dir = tempfile.mkdtemp()
+        base_output_dir = str(tmp_path)
         
         config = TestGenerationConfig(
             project_name="output_test",
@@ -3,8 +3,10 @@
 Test script to verify the analyzer functionality
 """
 
+import os
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -15,6 +17,7 @@ ensure_libclang_configured()
 
 from src.parser.compilation_db import CompilationDatabaseParser
 from src.analyzer.function_analyzer import FunctionAnalyzer
+from src.analyzer.clang_analyzer import ClangAnalyzer
 
 def test_c_project():
     """Test C project analysis"""
@@ -83,6 +86,50 @@ def test_cpp_project():
     # Assert that we can analyze C++ files (even if none found)
     assert len(all_functions) >= 0, "Should be able to analyze C++ files without errors"
 
+def test_translation_unit_reused_until_file_changes(tmp_path):
+    """Test that repeated parses of an unchanged file reuse one translation unit"""
+    source = tmp_path / "math.c"
+    source.write_text("int add(int a, int b) { return a + b; }\n")
+    
+    analyzer = ClangAnalyzer()
+    with patch('src.analyzer.clang_analyzer.clang.cindex.Index.create') as mock_create:
+        mock_parse = mock_create.return_value.parse
+        first = analyzer.parse_translation_unit(str(source), ['-std=c11'])
+        second = analyzer.parse_translation_unit(str(source), ['-std=c11'])
+        assert first is second
+        assert mock_parse.call_count == 1
+        
+        # Different compile args get their own translation unit
+        analyzer.parse_translation_unit(str(source), ['-std=c99'])
+        assert mock_parse.call_count == 2
+        
+        source.write_text("int add(int a, int b) { return b + a; }\n/* changed */\n")
+        analyzer.parse_translation_unit(str(source), ['-std=c11'])
+        assert mock_parse.call_count == 3
+        
+        # Every parse goes through the same libclang index
+        assert mock_create.call_count == 1
+
+def test_translation_unit_reused_when_only_mtime_changes(tmp_path):
+    """Test that touching a file without changing its contents does not reparse it"""
+    source = tmp_path / "math.c"
+    source.write_text("int add(int a, int b) { return a + b; }\n")
+    
+    analyzer = ClangAnalyzer()
+    with patch('src.analyzer.clang_analyzer.clang.cindex.Index.create') as mock_create:
+        mock_parse = mock_create.return_value.parse
+        first = analyzer.parse_translation_unit(str(source), ['-std=c11'])
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert analyzer.parse_translation_unit(str(source), ['-std=c11']) is first
+        assert mock_parse.call_count == 1
+        
+        # Same size, different contents
+        source.write_text("int add(int a, int b) { return b + a; }\n")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        analyzer.parse_translation_unit(str(source), ['-std=c11'])
+        assert mock_parse.call_count == 2
+
 def main():
     """Run all tests"""
     print("Testing AI-Driven Test Generator Analyzer")
@@ -333,6 +333,70 @@ class TestCompilationDatabaseParser:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_parse_with_and_without_orjson(self, orjson_available):
+        """Test that the stdlib fallback parses the same units and errors as orjson"""
+        compile_commands_data = [
+            {
+                "directory": "/project",
+                "file": "src/main.c",
+                "command": "gcc -I/include -DDEBUG -c src/main.c -o main.o"
+            }
+        ]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(compile_commands_data, f)
+            temp_path = f.name
+
+        try:
+            with patch('src.parser.compilation_db.ORJSON_AVAILABLE', orjson_available):
+                result = CompilationDatabaseParser(temp_path).parse()
+
+                Path(temp_path).write_text("[{ invalid json }]")
+                with pytest.raises(json.JSONDecodeError):
+                    CompilationDatabaseParser(temp_path).parse()
+
+            assert [unit['file'] for unit in result] == ["/project/src/main.c"]
+            assert result[0]['arguments'] == ['-I/include', '-DDEBUG']
+
+        finally:
+            Path(temp_path).unlink()
+
+    def test_parse_skips_duplicate_units(self):
+        """Test that entries with the same file and flags yield one unit"""
+        compile_commands_data = [
+            {
+                "directory": "/project",
+                "file": "src/main.c",
+                "command": "gcc -I/include -c src/main.c -o debug/main.o"
+            },
+            {
+                "directory": "/project",
+                "file": "/project/src/main.c",
+                "command": "gcc -I/include -c src/main.c -o release/main.o"
+            },
+            {
+                "directory": "/project",
+                "file": "src/main.c",
+                "command": "gcc -I/include -DNDEBUG -c src/main.c -o release/main.o"
+            }
+        ]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(compile_commands_data, f)
+            temp_path = f.name
+
+        try:
+            result = CompilationDatabaseParser(temp_path).parse()
+
+            assert [unit['arguments'] for unit in result] == [
+                ['-I/include'],
+                ['-I/include', '-DNDEBUG']
+            ]
+
+        finally:
+            Path(temp_path).unlink()
+
     def test_parse_empty_json_array(self):
         """Test parsing empty compilation database"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
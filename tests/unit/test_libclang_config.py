@@ -0,0 +1,42 @@
+"""
+Unit tests for libclang configuration
+"""
+
+from unittest.mock import patch
+
+from src.utils.libclang_config import LibclangConfig
+
+
+class TestLibclangConfig:
+    """Test libclang discovery caching"""
+
+    def test_failed_discovery_is_not_repeated(self, monkeypatch):
+        """Test that ensure_configured() probes the filesystem only once after a failure"""
+        monkeypatch.setattr(LibclangConfig, '_configured', False)
+        monkeypatch.setattr(LibclangConfig, '_discovery_failed', False)
+        monkeypatch.delenv('LIBCLANG_PATH', raising=False)
+
+        with patch('src.utils.libclang_config.clang.cindex.Config') as mock_config, \
+             patch('src.utils.libclang_config.os.path.exists', return_value=False) as mock_exists:
+            mock_config.library_file = None
+            mock_config.library_path = None
+
+            assert LibclangConfig.ensure_configured() is False
+            probes = mock_exists.call_count
+            assert LibclangConfig.ensure_configured() is False
+
+        assert probes > 0
+        assert mock_exists.call_count == probes
+
+    def test_explicit_path_after_failed_discovery(self, monkeypatch, tmp_path):
+        """Test that an explicit library path still configures after discovery failed"""
+        monkeypatch.setattr(LibclangConfig, '_configured', False)
+        monkeypatch.setattr(LibclangConfig, '_discovery_failed', True)
+        library = tmp_path / "libclang.so"
+        library.touch()
+
+        with patch('src.utils.libclang_config.clang.cindex.Config') as mock_config:
+            mock_config.library_file = None
+
+            assert LibclangConfig.configure(str(library)) is True
+            mock_config.set_library_file.assert_called_once_with(str(library))
@@ -118,6 +118,36 @@ def test_mock_guidance_generation():
     
     # Verify the guidance is specific to C++ (not the fallback C guidance)
     assert 'CMocka' not in prompt, "Should not contain C-specific mock framework references"
+
+
+def test_mock_guidance_is_rendered_lazily(monkeypatch):
+    """Test that mock_guidance is only rendered when the template references it"""
+    from src.test_generation.models import PromptContext
+
+    ctx = PromptContext.from_compressed_context({
+        'target_function': {
+            'name': 'add',
+            'signature': 'int add(int a, int b)',
+            'return_type': 'int',
+            'parameters': [],
+            'body': '',
+            'location': '/path/to/math.c:3',
+            'language': 'c'
+        },
+        'dependencies': {}
+    })
+
+    calls = []
+    monkeypatch.setattr(PromptTemplates, '_generate_mock_guidance',
+                        staticmethod(lambda c: calls.append(c) or 'MOCK_TEXT'))
+
+    context = PromptTemplates._prepare_jinja2_context(ctx)
+    assert calls == []
+
+    assert str(context['mock_guidance']) == 'MOCK_TEXT'
+    assert str(context['mock_guidance']) == 'MOCK_TEXT'
+    assert len(calls) == 1
+    assert not context['existing_tests']
     
 
 if __name__ == "__main__":
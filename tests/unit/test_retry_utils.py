@@ -3,6 +3,7 @@ Test retry utilities
 """
 
 import asyncio
+import threading
 import time
 import pytest
 from unittest.mock import Mock, patch
@@ -11,6 +12,10 @@ from src.utils.retry_utils import (
     BackoffStrategy,
     RetryConfig,
     CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryAborted,
+    RetryExhaustedError,
     calculate_delay,
     retry
 )
@@ -68,6 +73,30 @@ class TestRetryConfig:
         assert config.non_retryable_exceptions == (RuntimeError,)
         assert config.on_retry_callback == callback
 
+    def test_precomputed_delays_match_calculate_delay(self):
+        """Test that the per-attempt delay table matches calculate_delay"""
+        config = RetryConfig(
+            max_attempts=6,
+            base_delay=1.0,
+            max_delay=10.0,
+            backoff_strategy=BackoffStrategy.EXPONENTIAL
+        )
+
+        for attempt in range(1, 7):
+            assert config.get_delay(attempt) == calculate_delay(
+                attempt=attempt,
+                base_delay=1.0,
+                strategy=BackoffStrategy.EXPONENTIAL,
+                max_delay=10.0
+            )
+
+    def test_precomputed_jittered_delay_is_capped(self):
+        """Test that jittered delays from the table never exceed max_delay"""
+        config = RetryConfig(max_attempts=2000, base_delay=1.0, max_delay=5.0)
+
+        assert config.get_delay(2000) == 5.0
+        assert 0.75 <= config.get_delay(1) <= 1.25
+
 
 class TestCalculateDelay:
     """Test delay calculation for different strategies"""
@@ -157,7 +186,6 @@ class TestCircuitBreaker:
         assert breaker.failure_threshold == 3
         assert breaker.recovery_timeout == 30.0
         assert breaker.failure_count == 0
-        assert breaker.last_failure_time is None
         assert breaker.state == 'CLOSED'
 
     def test_success_in_closed_state(self):
@@ -194,7 +222,6 @@ class TestCircuitBreaker:
             asyncio.run(decorated())
         assert breaker.failure_count == 2
         assert breaker.state == 'OPEN'
-        assert breaker.last_failure_time is not None
 
     def test_open_circuit_blocks_calls(self):
         """Test that open circuit blocks calls"""
@@ -223,14 +250,19 @@ class TestCircuitBreaker:
             recovery_timeout=0.1
         )
 
+        async def fail_func():
+            raise ValueError("Test error")
+
         async def success_func():
             return "success"
 
         decorated = breaker(success_func)
 
-        # Open the circuit
-        breaker.state = 'OPEN'
-        breaker.last_failure_time = time.time() - 0.2  # Past recovery timeout
+        # Open the circuit and wait past the recovery timeout
+        with pytest.raises(ValueError):
+            asyncio.run(breaker(fail_func)())
+        assert breaker.state == 'OPEN'
+        time.sleep(0.2)
 
         # Next call should transition to half-open and succeed
         result = asyncio.run(decorated())
@@ -257,6 +289,50 @@ class TestCircuitBreaker:
         assert breaker.state == 'OPEN'
         assert breaker.failure_count == 2
 
+    def test_open_circuit_raises_circuit_open_error(self):
+        """Test that rejected calls raise the dedicated CircuitOpenError"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+
+        async def fail_func():
+            raise ValueError("Test error")
+
+        async def success_func():
+            return "success"
+
+        with pytest.raises(ValueError):
+            asyncio.run(breaker(fail_func)())
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(breaker(success_func)())
+
+    def test_half_open_admits_single_trial_call(self):
+        """Test that concurrent callers cannot all pass the HALF_OPEN transition"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
+
+        async def fail_func():
+            raise ValueError("Test error")
+
+        with pytest.raises(ValueError):
+            asyncio.run(breaker(fail_func)())
+        time.sleep(0.2)
+
+        async def slow_success():
+            await asyncio.sleep(0.01)
+            return "success"
+
+        decorated = breaker(slow_success)
+
+        async def run_concurrently():
+            return await asyncio.gather(
+                decorated(), decorated(), decorated(), return_exceptions=True
+            )
+
+        results = asyncio.run(run_concurrently())
+
+        assert results.count("success") == 1
+        assert sum(isinstance(r, CircuitOpenError) for r in results) == 2
+        assert breaker.state == CircuitState.CLOSED
+
 
 class TestRetryDecorator:
     """Test retry decorator functionality"""
@@ -295,10 +371,83 @@ class TestRetryDecorator:
         def test_func():
             return func()
 
-        with pytest.raises(ValueError, match="persistent error"):
+        with pytest.raises(RetryExhaustedError) as exc_info:
             test_func()
 
         assert func.call_count == 3
+        assert exc_info.value.attempts == 3
+        assert isinstance(exc_info.value.__cause__, ValueError)
+        assert str(exc_info.value.__cause__) == "persistent error"
+
+    def test_retry_terminal_attempt_does_not_sleep(self):
+        """Test that no delay is computed or slept after the last attempt"""
+        func = Mock(side_effect=ValueError("persistent error"))
+
+        @retry(max_attempts=3, base_delay=0)
+        def test_func():
+            return func()
+
+        with patch.object(RetryConfig, 'get_delay', return_value=0) as mock_delay, \
+             patch('src.utils.retry_utils.time.sleep') as mock_sleep:
+            with pytest.raises(RetryExhaustedError):
+                test_func()
+
+        assert mock_delay.call_count == 2
+        assert mock_sleep.call_count == 2
+
+    def test_async_retry_yields_without_timer_for_tiny_delays(self):
+        """Test that delays below min_sleep only yield to the event loop"""
+        func = Mock(side_effect=[ValueError("error"), "success"])
+
+        @retry(max_attempts=2, base_delay=0.0001)
+        async def test_func():
+            return func()
+
+        with patch('src.utils.retry_utils.asyncio.sleep', wraps=asyncio.sleep) as mock_sleep:
+            result = asyncio.run(test_func())
+
+        assert result == "success"
+        mock_sleep.assert_called_once_with(0)
+
+    def test_sync_retry_aborts_when_stop_event_is_set(self):
+        """Test that setting stop_event interrupts the wait between attempts"""
+        stop_event = threading.Event()
+        stop_event.set()
+        func = Mock(side_effect=ValueError("error"))
+        config = RetryConfig(
+            max_attempts=3,
+            base_delay=30.0,
+            backoff_strategy=BackoffStrategy.FIXED,
+            stop_event=stop_event
+        )
+
+        @retry(config=config)
+        def test_func():
+            return func()
+
+        start = time.time()
+        with pytest.raises(RetryAborted) as exc_info:
+            test_func()
+
+        assert time.time() - start < 1.0
+        assert func.call_count == 1
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
+    def test_retry_skips_warning_formatting_when_disabled(self):
+        """Test that retry warnings are not formatted when WARNING is disabled"""
+        error = ValueError("error")
+        func = Mock(side_effect=[error, "success"])
+
+        @retry(max_attempts=2, base_delay=0.0, backoff_strategy=BackoffStrategy.FIXED)
+        def test_func():
+            return func()
+
+        with patch('src.utils.retry_utils.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            result = test_func()
+
+        assert result == "success"
+        mock_logger.warning.assert_not_called()
 
     def test_retry_with_non_retryable_exception(self):
         """Test that non-retryable exceptions are not retried"""
@@ -6,7 +6,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
-from src.utils.test_file_matcher import TestFileMatcher
+from src.utils.test_file_matcher import TestFileMatcher, _iter_files
 
 
 class TestTestFileMatcher(unittest.TestCase):
@@ -95,6 +95,37 @@ class TestTestFileMatcher(unittest.TestCase):
         test_file = self.matcher.find_matching_test_file("src/nonexistent.c")
         self.assertIsNone(test_file)
     
+    def test_find_matching_test_file_uses_single_directory_walk(self):
+        """测试子目录中的测试文件通过一次目录遍历建立的索引匹配"""
+        nested_dir = self.test_dir / "unit"
+        nested_dir.mkdir()
+        (nested_dir / "test_parser.cpp").touch()
+        (nested_dir / "Lexer_Test.cc").touch()
+        
+        with patch('src.utils.test_file_matcher._iter_files', wraps=_iter_files) as mock_walk:
+            parser_test = self.matcher.find_matching_test_file("src/parser.c")
+            lexer_test = self.matcher.find_matching_test_file("src/lexer.cpp")
+            missing = self.matcher.find_matching_test_file("src/missing.c")
+        
+        self.assertTrue(parser_test.endswith("test_parser.cpp"))
+        self.assertTrue(lexer_test.endswith("Lexer_Test.cc"))
+        self.assertIsNone(missing)
+        self.assertEqual(mock_walk.call_count, 1)
+    
+    def test_find_matching_test_file_caches_result_per_source(self):
+        """测试同一源文件的重复查询复用首次匹配结果"""
+        with patch.object(self.matcher, '_find_test_file_for_source',
+                          wraps=self.matcher._find_test_file_for_source) as mock_find:
+            first = self.matcher.find_matching_test_file("src/math_utils.c")
+            second = self.matcher.find_matching_test_file(str(self.project_path / "src" / "math_utils.c"))
+            missing = self.matcher.find_matching_test_file("src/missing.c")
+            missing_again = self.matcher.find_matching_test_file("src/missing.c")
+        
+        self.assertEqual(first, second)
+        self.assertIsNone(missing)
+        self.assertIsNone(missing_again)
+        self.assertEqual(mock_find.call_count, 2)
+    
     def test_is_matching_test_file(self):
         """测试测试文件匹配逻辑"""
         # xxx_test 格式
@@ -151,6 +182,60 @@ void test_multiply() {
         self.assertIn('TEST(MathUtilsTest, TestSubtract)', function_names)
         self.assertIn('test_multiply', function_names)
     
+    def test_extract_test_functions_reuses_parse_until_file_changes(self):
+        """测试文件未修改时复用解析结果，修改后重新解析"""
+        test_file = self.test_dir / "math_utils_test.cpp"
+        test_file.write_text("TEST(MathUtilsTest, TestAdd) {\n    EXPECT_EQ(add(2, 3), 5);\n}\n")
+        
+        with patch('builtins.open', wraps=open) as mock_file:
+            first = self.matcher.extract_test_functions(str(test_file))
+            second = self.matcher.extract_test_functions(str(test_file))
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_file.call_count, 1)
+        
+        test_file.write_text("TEST(MathUtilsTest, TestAdd) {}\nTEST(MathUtilsTest, TestSub) {}\n")
+        updated = self.matcher.extract_test_functions(str(test_file))
+        self.assertEqual(len(updated), 2)
+    
+    def test_get_existing_tests_extracts_only_related_bodies(self):
+        """测试按函数名过滤时只为相关测试提取函数体"""
+        test_file = self.test_dir / "math_utils_test.c"
+        test_file.write_text(
+            "TEST(MathUtilsTest, AddBasic) { EXPECT_EQ(add(2, 3), 5); }\n"
+            "TEST(MathUtilsTest, SubtractBasic) { EXPECT_EQ(subtract(5, 3), 2); }\n"
+            "void test_multiply() { assert(multiply(2, 3) == 6); }\n"
+        )
+        
+        with patch.object(self.matcher, '_extract_function_body',
+                          wraps=self.matcher._extract_function_body) as mock_body:
+            tests = self.matcher.get_existing_tests_for_function("src/math_utils.c", "subtract")
+        
+        self.assertEqual([t['name'] for t in tests], ['TEST(MathUtilsTest, SubtractBasic)'])
+        self.assertEqual(tests[0]['code'], 'EXPECT_EQ(subtract(5, 3), 2);')
+        self.assertEqual(mock_body.call_count, 1)
+    
+    def test_extract_test_classes_reuses_cached_content(self):
+        """测试提取测试类时复用已缓存的文件内容"""
+        test_file = self.test_dir / "math_utils_test.cpp"
+        test_file.write_text(
+            "class MathUtilsTest : public ::testing::Test {\n"
+            "protected:\n"
+            "    void SetUp() override { value = 1; }\n"
+            "    int value;\n"
+            "};\n"
+            "TEST_F(MathUtilsTest, AddBasic) { EXPECT_EQ(add(value, 1), 2); }\n"
+        )
+        
+        with patch('builtins.open', wraps=open) as mock_file:
+            test_functions = self.matcher.extract_test_functions(str(test_file))
+            test_classes = self.matcher.extract_test_classes(str(test_file))
+        
+        self.assertEqual(len(test_functions), 1)
+        self.assertEqual([c['name'] for c in test_classes], ['MathUtilsTest'])
+        self.assertTrue(test_classes[0]['definition'].endswith('};'))
+        self.assertEqual(mock_file.call_count, 1)
+    
     def test_get_test_context_summary(self):
         """测试获取测试上下文摘要"""
         # 创建一个测试文件内容
@@ -188,6 +273,16 @@ void test_multiply() {
         self.assertGreater(len(impl_files), 0)
         impl_names = [f.name for f in impl_files]
         self.assertIn("math_utils.c", impl_names)
+    
+    def test_find_implementation_files_walks_project_once(self):
+        """测试多个头文件查找实现文件时只遍历一次项目目录"""
+        with patch('src.utils.test_file_matcher._iter_files', wraps=_iter_files) as mock_walk:
+            math_impls = self.matcher._find_implementation_files(self.project_path / "src" / "math_utils.h")
+            string_impls = self.matcher._find_implementation_files(self.project_path / "src" / "string_utils.hpp")
+        
+        self.assertEqual([f.name for f in math_impls], ["math_utils.c"])
+        self.assertEqual([f.name for f in string_impls], ["string_utils.cpp"])
+        self.assertEqual(mock_walk.call_count, 1)
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ Unit tests for TokenCounter utility
 
 import pytest
 from unittest.mock import patch, MagicMock
-from src.utils.token_counter import TokenCounter, TIKTOKEN_AVAILABLE
+from src.utils.token_counter import TokenCounter, TIKTOKEN_AVAILABLE, _get_encoder
 
 
 def test_token_counter_initialization():
@@ -25,6 +25,21 @@ def test_token_counter_initialization():
     assert counter.model == "mock"
 
 
+def test_encoder_shared_across_instances():
+    """Test that tiktoken encoders are loaded once per model"""
+    _get_encoder.cache_clear()
+    try:
+        with patch('src.utils.token_counter.TIKTOKEN_AVAILABLE', True), \
+             patch('src.utils.token_counter.tiktoken', create=True) as mock_tiktoken:
+            first = TokenCounter("openai", "gpt-4")
+            second = TokenCounter("deepseek", "gpt-4")
+        
+        assert first.encoder is second.encoder
+        assert mock_tiktoken.encoding_for_model.call_count == 1
+    finally:
+        _get_encoder.cache_clear()
+
+
 def test_count_tokens_with_tiktoken():
     """Test token counting when tiktoken is available"""
     if not TIKTOKEN_AVAILABLE:
@@ -79,6 +94,23 @@ def test_count_tokens_from_dict():
     assert token_count > 0
 
 
+def test_count_tokens_from_dict_batch_encodes_leaves():
+    """Test that dictionary leaves are encoded in a single batch"""
+    with patch('src.utils.token_counter.TIKTOKEN_AVAILABLE', False):
+        counter = TokenCounter("mock", "mock")
+    
+    encoder = MagicMock()
+    encoder.encode_batch.side_effect = lambda texts, num_threads: [t.split() for t in texts]
+    counter.encoder = encoder
+    
+    token_count = counter.count_tokens_from_dict({"name": "a b c", "params": [1, 2]})
+    
+    encoder.encode_batch.assert_called_once()
+    encoder.encode.assert_not_called()
+    # 7 leaf tokens + 3 for the dict + 3 for the list
+    assert token_count == 13
+
+
 def test_get_model_limit():
     """Test getting model token limits"""
     # Test known models
@@ -126,6 +158,9 @@ def test_estimate_tokens_static():
     # Test exact multiples
     assert TokenCounter.estimate_tokens("x" * 4) == 1
     assert TokenCounter.estimate_tokens("x" * 8) == 2
+    
+    # Non-ASCII text is estimated from its UTF-8 byte length
+    assert TokenCounter.estimate_tokens("测试用例") == 3  # 12 bytes // 4 = 3
 
 
 def test_create_token_counter_factory():